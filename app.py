@@ -5,15 +5,53 @@ Streamlit을 사용한 인터랙티브 금융 파생상품 시뮬레이션 대
 """
 
 import streamlit as st
-import sys
-import os
 
-# 경로 설정
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-
-from models.black_scholes import BlackScholesModel
-from models.futures import FuturesModel
+from models.black_scholes import cached_bs_model
+from models.futures import cached_futures_model
 from utils.visualization import create_payoff_diagram, create_greeks_heatmap
+from ui.static import CUSTOM_CSS, HEADER_HTML, SUBHEADER_HTML, FOOTER_HTML
+
+
+# ===== 계산 캐시 =====
+# Streamlit은 위젯이 바뀔 때마다 스크립트 전체를 다시 실행하므로,
+# 입력값이 같으면 이전 계산 결과를 재사용합니다.
+def _rounded(*values: float) -> tuple:
+    """부동소수점 오차로 캐시 키가 달라지지 않도록 입력값 반올림"""
+    return tuple(round(v, 10) for v in values)
+
+
+@st.cache_data(show_spinner=False)
+def _price_and_greeks(S: float, K: float, T: float, r: float, sigma: float,
+                      option_type: str) -> dict:
+    """옵션 가격, 가치 분해, Greeks 계산"""
+    bs = cached_bs_model(S, K, T, r, sigma)
+    call_price, put_price = bs.price_both()
+    price = call_price if option_type == 'call' else put_price
+    return {
+        'call': call_price,
+        'put': put_price,
+        'intrinsic': bs.intrinsic_value(option_type),
+        'time_val': bs.time_value(option_type, price),
+        'greeks': bs.get_all_greeks(option_type)
+    }
+
+
+@st.cache_data(show_spinner=False)
+def _futures_calc(S: float, r: float, q: float, T: float) -> float:
+    """이론적 선물 가격 계산"""
+    return cached_futures_model(S, r, q, T).theoretical_price()
+
+
+@st.cache_resource(show_spinner=False)
+def _static_html() -> tuple:
+    """정적 CSS/HTML 조각 (세션 간 공유)"""
+    return CUSTOM_CSS, HEADER_HTML, SUBHEADER_HTML, FOOTER_HTML
+
+
+@st.cache_resource(show_spinner=False)
+def _greeks_heatmap_fig(K: float, T: float, r: float, greek: str, option_type: str):
+    """Greeks 히트맵 생성 (Figure 객체를 직렬화 없이 그대로 재사용)"""
+    return create_greeks_heatmap(K, T, r, greek, option_type)
 
 # 페이지 설정
 st.set_page_config(
@@ -23,34 +61,11 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# 커스텀 CSS
-st.markdown("""
-    <style>
-    .main-header {
-        font-size: 2.5rem;
-        font-weight: bold;
-        color: #1f77b4;
-        text-align: center;
-        padding: 1rem 0;
-    }
-    .sub-header {
-        font-size: 1.2rem;
-        color: #666;
-        text-align: center;
-        padding-bottom: 2rem;
-    }
-    .metric-card {
-        background-color: #f0f2f6;
-        padding: 1rem;
-        border-radius: 0.5rem;
-        margin: 0.5rem 0;
-    }
-    </style>
-""", unsafe_allow_html=True)
-
-# 헤더
-st.markdown('<div class="main-header">📊 파생상품 시뮬레이션 대시보드</div>', unsafe_allow_html=True)
-st.markdown('<div class="sub-header">Financial Derivatives Simulation Dashboard</div>', unsafe_allow_html=True)
+# 커스텀 CSS 및 헤더
+css, header, subheader, footer = _static_html()
+st.markdown(css, unsafe_allow_html=True)
+st.markdown(header, unsafe_allow_html=True)
+st.markdown(subheader, unsafe_allow_html=True)
 
 # 사이드바 메뉴
 st.sidebar.title("📑 메뉴")
@@ -140,14 +155,15 @@ elif menu == "📈 옵션 계산기":
 
     if st.button("💰 계산하기", type="primary"):
         try:
-            bs = BlackScholesModel(S, K, T, r, sigma)
+            S, K, T, r, sigma = _rounded(S, K, T, r, sigma)
+            result = _price_and_greeks(S, K, T, r, sigma, option_type.lower())
 
             # 옵션 가격
-            call_price = bs.call_price()
-            put_price = bs.put_price()
+            call_price = result['call']
+            put_price = result['put']
 
             # Greeks
-            greeks = bs.get_all_greeks(option_type.lower())
+            greeks = result['greeks']
 
             # 결과 표시
             st.markdown("---")
@@ -160,10 +176,10 @@ elif menu == "📈 옵션 계산기":
             with col2:
                 st.metric("풋 옵션 가격", f"${put_price:.4f}")
             with col3:
-                intrinsic = bs.intrinsic_value(option_type.lower())
+                intrinsic = result['intrinsic']
                 st.metric("내재가치", f"${intrinsic:.4f}")
             with col4:
-                time_val = bs.time_value(option_type.lower())
+                time_val = result['time_val']
                 st.metric("시간가치", f"${time_val:.4f}")
 
             # Greeks 표시
@@ -173,16 +189,16 @@ elif menu == "📈 옵션 계산기":
             greeks_col1, greeks_col2, greeks_col3 = st.columns(3)
 
             with greeks_col1:
-                st.metric("Delta (Δ)", f"{greeks['delta']:.4f}")
-                st.metric("Gamma (Γ)", f"{greeks['gamma']:.4f}")
+                st.metric("Delta (Δ)", f"{greeks.delta:.4f}")
+                st.metric("Gamma (Γ)", f"{greeks.gamma:.4f}")
 
             with greeks_col2:
-                st.metric("Theta (Θ) - 연간", f"{greeks['theta']:.4f}")
-                st.metric("Theta (Θ) - 일일", f"{greeks['theta_daily']:.4f}")
+                st.metric("Theta (Θ) - 연간", f"{greeks.theta:.4f}")
+                st.metric("Theta (Θ) - 일일", f"{greeks.theta_daily:.4f}")
 
             with greeks_col3:
-                st.metric("Vega (ν)", f"{greeks['vega']:.4f}")
-                st.metric("Rho (ρ)", f"{greeks['rho']:.4f}")
+                st.metric("Vega (ν)", f"{greeks.vega:.4f}")
+                st.metric("Rho (ρ)", f"{greeks.rho:.4f}")
 
             # 손익 다이어그램
             st.markdown("---")
@@ -197,8 +213,8 @@ elif menu == "📈 옵션 계산기":
             **{option_type} 옵션 분석 결과**
 
             - 현재 옵션은 {'ITM (In-The-Money)' if intrinsic > 0 else 'OTM (Out-of-The-Money)' if intrinsic == 0 else 'ATM (At-The-Money)'}입니다.
-            - Delta는 {greeks['delta']:.4f}로, 기초자산 가격이 $1 상승하면 옵션 가격은 약 ${abs(greeks['delta']):.4f} {'상승' if greeks['delta'] > 0 else '하락'}합니다.
-            - Theta는 하루에 약 ${abs(greeks['theta_daily']):.4f}의 시간 가치가 감소합니다.
+            - Delta는 {greeks.delta:.4f}로, 기초자산 가격이 $1 상승하면 옵션 가격은 약 ${abs(greeks.delta):.4f} {'상승' if greeks.delta > 0 else '하락'}합니다.
+            - Theta는 하루에 약 ${abs(greeks.theta_daily):.4f}의 시간 가치가 감소합니다.
             """)
 
         except Exception as e:
@@ -222,8 +238,8 @@ elif menu == "📊 선물 계산기":
 
     if st.button("💰 계산하기", type="primary"):
         try:
-            futures = FuturesModel(S, r, q, T)
-            theo_price = futures.theoretical_price()
+            S, r, q, T = _rounded(S, r, q, T)
+            theo_price = _futures_calc(S, r, q, T)
 
             st.markdown("---")
             st.subheader("💰 계산 결과")
@@ -246,6 +262,7 @@ elif menu == "📊 선물 계산기":
             transaction_cost = st.number_input("거래비용 (%)", value=0.1, step=0.01) / 100
 
             if st.button("차익거래 분석"):
+                futures = cached_futures_model(S, r, q, T)
                 arb_analysis = futures.arbitrage_profit(market_price, transaction_cost)
 
                 col1, col2 = st.columns(2)
@@ -287,7 +304,8 @@ elif menu == "🎯 Greeks 분석":
 
     if st.button("📊 히트맵 생성", type="primary"):
         try:
-            fig = create_greeks_heatmap(K, T, r, greek_type.lower(), option_type.lower())
+            K, T, r = _rounded(K, T, r)
+            fig = _greeks_heatmap_fig(K, T, r, greek_type.lower(), option_type.lower())
             st.plotly_chart(fig, use_container_width=True)
 
             # Greek 설명
@@ -417,9 +435,4 @@ elif menu == "📚 이론 설명":
 
 # 푸터
 st.markdown("---")
-st.markdown("""
-<div style='text-align: center; color: #666; padding: 1rem;'>
-    <p>📊 파생상품 시뮬레이션 대시보드 v1.0</p>
-    <p>⚠️ 교육용 도구입니다. 실제 투자 결정에 사용하지 마세요.</p>
-</div>
-""", unsafe_allow_html=True)
+st.markdown(footer, unsafe_allow_html=True)
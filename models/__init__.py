@@ -4,6 +4,18 @@
 이 패키지는 파생상품 가격 계산을 위한 다양한 금융 모델을 포함합니다.
 """
 
-from .black_scholes import BlackScholesModel, calculate_implied_volatility
+from .black_scholes import (
+    BlackScholesModel,
+    Greeks,
+    cached_bs_model,
+    calculate_implied_volatility,
+    calculate_implied_volatility_vec,
+)
 
-__all__ = ['BlackScholesModel', 'calculate_implied_volatility']
+__all__ = [
+    'BlackScholesModel',
+    'Greeks',
+    'cached_bs_model',
+    'calculate_implied_volatility',
+    'calculate_implied_volatility_vec',
+]
@@ -0,0 +1,83 @@
+"""
+Black-Scholes 배치 계산 커널 (Numba)
+
+여러 옵션의 가격과 Greeks를 한 번의 컴파일된 루프로 계산합니다.
+`BlackScholesModel.price_greeks_batch`에서 사용합니다.
+"""
+
+import math
+
+import numpy as np
+from numba import njit, prange
+
+
+_INV_SQRT_2 = 1.0 / math.sqrt(2.0)
+_INV_SQRT_2PI = 1.0 / math.sqrt(2.0 * math.pi)
+
+
+@njit(cache=True)
+def _ncdf(x):
+    """표준정규분포 누적분포함수 N(x)"""
+    return 0.5 * math.erfc(-x * _INV_SQRT_2)
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _bs_batch(S, K, T, r, sigma, is_call,
+              out_price, out_delta, out_gamma, out_vega, out_theta, out_rho):
+    for i in prange(S.size):
+        rT = r[i] * T[i]
+        sqrtT = math.sqrt(T[i])
+        sig_sqrtT = sigma[i] * sqrtT
+        d1 = (math.log(S[i] / K[i]) + rT + 0.5 * sigma[i] * sigma[i] * T[i]) / sig_sqrtT
+        d2 = d1 - sig_sqrtT
+
+        strike_pv = K[i] * math.exp(-rT)
+        nd1 = _ncdf(d1)
+        nd2 = _ncdf(d2)
+        pd1 = _INV_SQRT_2PI * math.exp(-0.5 * d1 * d1)
+        theta_decay = -(S[i] * pd1 * sigma[i]) / (2.0 * sqrtT)
+
+        if is_call[i]:
+            out_price[i] = S[i] * nd1 - strike_pv * nd2
+            out_delta[i] = nd1
+            out_theta[i] = theta_decay - r[i] * strike_pv * nd2
+            out_rho[i] = T[i] * strike_pv * nd2 / 100.0
+        else:
+            # 1 - N(d) 대신 N(-d): 깊은 외가격 풋의 자릿수 손실 방지
+            nd2_neg = _ncdf(-d2)
+            out_price[i] = strike_pv * nd2_neg - S[i] * _ncdf(-d1)
+            out_delta[i] = nd1 - 1.0
+            out_theta[i] = theta_decay + r[i] * strike_pv * nd2_neg
+            out_rho[i] = -T[i] * strike_pv * nd2_neg / 100.0
+
+        out_gamma[i] = pd1 / (S[i] * sig_sqrtT)
+        out_vega[i] = S[i] * pd1 * sqrtT / 100.0
+
+
+def bs_price_greeks_batch(S, K, T, r, sigma, is_call):
+    """
+    옵션 가격과 Greeks를 배열 단위로 계산
+
+    Parameters
+    ----------
+    S, K, T, r, sigma : array_like
+        Black-Scholes 파라미터 (서로 브로드캐스팅 가능해야 함)
+    is_call : array_like of bool
+        콜 옵션이면 True, 풋 옵션이면 False
+
+    Returns
+    -------
+    tuple of np.ndarray
+        (price, delta, gamma, vega, theta, rho), 단위는 `BlackScholesModel`과 동일
+    """
+    shape = np.broadcast_shapes(*(np.shape(x) for x in (S, K, T, r, sigma, is_call)))
+    S, K, T, r, sigma = (
+        np.ascontiguousarray(np.broadcast_to(np.asarray(x, dtype=np.float64), shape)).ravel()
+        for x in (S, K, T, r, sigma)
+    )
+    is_call = np.ascontiguousarray(np.broadcast_to(np.asarray(is_call, dtype=np.bool_), shape)).ravel()
+
+    outputs = tuple(np.empty(S.size, dtype=np.float64) for _ in range(6))
+    _bs_batch(S, K, T, r, sigma, is_call, *outputs)
+
+    return tuple(out.reshape(shape) for out in outputs)
@@ -4,9 +4,41 @@ Black-Scholes 옵션 가격 계산 모델
 이 모듈은 Black-Scholes-Merton 모델을 사용하여 유럽형 옵션의 가격과 Greeks를 계산합니다.
 """
 
+import functools
+import math
+from typing import NamedTuple, Optional, Tuple
+
 import numpy as np
-from scipy.stats import norm
-from typing import Dict, Tuple
+
+
+_INV_SQRT_2 = 1.0 / math.sqrt(2.0)
+_INV_SQRT_2PI = 1.0 / math.sqrt(2.0 * math.pi)
+
+
+def _ncdf(x: float) -> float:
+    """표준정규분포 누적분포함수 N(x)"""
+    # 0.5 * (1 + erf(x/√2))와 같지만, 왼쪽 꼬리에서 정밀도 손실이 없음
+    return 0.5 * math.erfc(-x * _INV_SQRT_2)
+
+
+def _npdf(x: float) -> float:
+    """표준정규분포 확률밀도함수 n(x)"""
+    return _INV_SQRT_2PI * math.exp(-0.5 * x * x)
+
+
+def _npdf_array(x: np.ndarray) -> np.ndarray:
+    """표준정규분포 확률밀도함수 n(x) (배열용, N(x)는 scipy.special.ndtr 사용)"""
+    return _INV_SQRT_2PI * np.exp(-0.5 * x * x)
+
+
+class Greeks(NamedTuple):
+    """옵션 Greeks 묶음"""
+    delta: float
+    gamma: float
+    theta: float
+    theta_daily: float
+    vega: float
+    rho: float
 
 
 class BlackScholesModel:
@@ -35,6 +67,24 @@ class BlackScholesModel:
     """
 
     def __init__(self, S: float, K: float, T: float, r: float, sigma: float):
+        self._validate(S, K, T, sigma)
+        self._setup(S, K, T, r, sigma)
+
+    @classmethod
+    def from_trusted(cls, S: float, K: float, T: float, r: float,
+                     sigma: float) -> 'BlackScholesModel':
+        """
+        입력 검증 없이 모델 생성
+
+        위젯 범위 등으로 이미 검증된 입력에만 사용해야 합니다.
+        """
+        obj = cls.__new__(cls)
+        obj._setup(S, K, T, r, sigma)
+        return obj
+
+    @staticmethod
+    def _validate(S: float, K: float, T: float, sigma: float) -> None:
+        """입력 파라미터 검증"""
         if S <= 0:
             raise ValueError("기초자산 가격(S)은 0보다 커야 합니다.")
         if K <= 0:
@@ -44,21 +94,64 @@ class BlackScholesModel:
         if sigma <= 0:
             raise ValueError("변동성(sigma)은 0보다 커야 합니다.")
 
-        self.S = S
-        self.K = K
-        self.T = T
-        self.r = r
-        self.sigma = sigma
+    def _setup(self, S: float, K: float, T: float, r: float, sigma: float) -> None:
+        """파라미터 저장 및 공통 항 계산"""
+        # NumPy 스칼라가 들어와도 결과가 Python float이 되도록 경계에서 변환
+        S, K, T, r, sigma = float(S), float(K), float(T), float(r), float(sigma)
+
+        # 아래 공통 항이 입력값에 묶여 있으므로 입력은 읽기 전용 속성으로만 노출
+        self._S = S
+        self._K = K
+        self._T = T
+        self._r = r
+        self._sigma = sigma
+
+        # 모든 가격/Greeks 계산에서 공유하는 항을 한 번만 계산
+        rT = r * T
+        self._sqrtT = math.sqrt(T)
+        sig_sqrtT = sigma * self._sqrtT
+        self._discount = math.exp(-rT)
+        self._d1 = (math.log(S / K) + rT + 0.5 * sigma * sigma * T) / sig_sqrtT
+        self._d2 = self._d1 - sig_sqrtT
+        self._nd1 = _ncdf(self._d1)
+        self._nd2 = _ncdf(self._d2)
+        # 풋 쪽은 1 - N(d)로 구하면 깊은 외가격에서 자릿수가 사라지므로 N(-d)를 따로 계산
+        self._nd1_neg = _ncdf(-self._d1)
+        self._nd2_neg = _ncdf(-self._d2)
+        self._pd1 = _npdf(self._d1)
+
+    @property
+    def S(self) -> float:
+        """기초자산 가격 (읽기 전용)"""
+        return self._S
+
+    @property
+    def K(self) -> float:
+        """행사가격 (읽기 전용)"""
+        return self._K
+
+    @property
+    def T(self) -> float:
+        """만기 (읽기 전용)"""
+        return self._T
+
+    @property
+    def r(self) -> float:
+        """무위험 이자율 (읽기 전용)"""
+        return self._r
+
+    @property
+    def sigma(self) -> float:
+        """변동성 (읽기 전용)"""
+        return self._sigma
 
     def d1(self) -> float:
         """Black-Scholes d1 계산"""
-        numerator = np.log(self.S / self.K) + (self.r + 0.5 * self.sigma**2) * self.T
-        denominator = self.sigma * np.sqrt(self.T)
-        return numerator / denominator
+        return self._d1
 
     def d2(self) -> float:
         """Black-Scholes d2 계산"""
-        return self.d1() - self.sigma * np.sqrt(self.T)
+        return self._d2
 
     def call_price(self) -> float:
         """
@@ -69,9 +162,7 @@ class BlackScholesModel:
         float
             콜 옵션의 이론적 가격
         """
-        d1 = self.d1()
-        d2 = self.d2()
-        price = self.S * norm.cdf(d1) - self.K * np.exp(-self.r * self.T) * norm.cdf(d2)
+        price = self._S * self._nd1 - self._K * self._discount * self._nd2
         return price
 
     def put_price(self) -> float:
@@ -83,18 +174,32 @@ class BlackScholesModel:
         float
             풋 옵션의 이론적 가격
         """
-        d1 = self.d1()
-        d2 = self.d2()
-        price = self.K * np.exp(-self.r * self.T) * norm.cdf(-d2) - self.S * norm.cdf(-d1)
+        price = self._K * self._discount * self._nd2_neg - self._S * self._nd1_neg
         return price
 
+    def price_both(self) -> Tuple[float, float]:
+        """
+        콜/풋 옵션 가격을 한 번에 계산
+
+        풋 가격은 풋-콜 패리티(P = C - S + K·e^(-rT))로 구합니다.
+
+        Returns
+        -------
+        tuple
+            (콜 옵션 가격, 풋 옵션 가격)
+        """
+        strike_pv = self._K * self._discount
+        call = self._S * self._nd1 - strike_pv * self._nd2
+        put = call - self._S + strike_pv
+        return call, put
+
     def call_delta(self) -> float:
         """콜 옵션 Delta (기초자산 가격 민감도)"""
-        return norm.cdf(self.d1())
+        return self._nd1
 
     def put_delta(self) -> float:
         """풋 옵션 Delta"""
-        return norm.cdf(self.d1()) - 1
+        return self._nd1 - 1
 
     def gamma(self) -> float:
         """
@@ -102,8 +207,7 @@ class BlackScholesModel:
 
         콜과 풋 모두 동일한 Gamma 값을 가집니다.
         """
-        d1 = self.d1()
-        return norm.pdf(d1) / (self.S * self.sigma * np.sqrt(self.T))
+        return self._pd1 / (self._S * self._sigma * self._sqrtT)
 
     def vega(self) -> float:
         """
@@ -111,8 +215,7 @@ class BlackScholesModel:
 
         1% 변동성 변화 시 옵션 가격 변화 (0.01 단위)
         """
-        d1 = self.d1()
-        return self.S * norm.pdf(d1) * np.sqrt(self.T) / 100
+        return self._S * self._pd1 * self._sqrtT / 100
 
     def call_theta(self) -> float:
         """
@@ -120,18 +223,14 @@ class BlackScholesModel:
 
         연간 단위이므로, 일일 Theta는 이 값을 365로 나눕니다.
         """
-        d1 = self.d1()
-        d2 = self.d2()
-        term1 = -(self.S * norm.pdf(d1) * self.sigma) / (2 * np.sqrt(self.T))
-        term2 = -self.r * self.K * np.exp(-self.r * self.T) * norm.cdf(d2)
+        term1 = -(self._S * self._pd1 * self._sigma) / (2 * self._sqrtT)
+        term2 = -self._r * self._K * self._discount * self._nd2
         return term1 + term2
 
     def put_theta(self) -> float:
         """풋 옵션 Theta"""
-        d1 = self.d1()
-        d2 = self.d2()
-        term1 = -(self.S * norm.pdf(d1) * self.sigma) / (2 * np.sqrt(self.T))
-        term2 = self.r * self.K * np.exp(-self.r * self.T) * norm.cdf(-d2)
+        term1 = -(self._S * self._pd1 * self._sigma) / (2 * self._sqrtT)
+        term2 = self._r * self._K * self._discount * self._nd2_neg
         return term1 + term2
 
     def call_rho(self) -> float:
@@ -140,17 +239,15 @@ class BlackScholesModel:
 
         1% 이자율 변화 시 옵션 가격 변화 (0.01 단위)
         """
-        d2 = self.d2()
-        return self.K * self.T * np.exp(-self.r * self.T) * norm.cdf(d2) / 100
+        return self._K * self._T * self._discount * self._nd2 / 100
 
     def put_rho(self) -> float:
         """풋 옵션 Rho"""
-        d2 = self.d2()
-        return -self.K * self.T * np.exp(-self.r * self.T) * norm.cdf(-d2) / 100
+        return -self._K * self._T * self._discount * self._nd2_neg / 100
 
-    def get_all_greeks(self, option_type: str = 'call') -> Dict[str, float]:
+    def get_all_greeks(self, option_type: str = 'call') -> Greeks:
         """
-        모든 Greeks를 딕셔너리로 반환
+        모든 Greeks를 NamedTuple로 반환
 
         Parameters
         ----------
@@ -159,27 +256,36 @@ class BlackScholesModel:
 
         Returns
         -------
-        dict
-            모든 Greeks 값
+        Greeks
+            모든 Greeks 값 (딕셔너리가 필요하면 `_asdict()` 사용)
         """
+        # 공통 항을 한 번만 계산해 모든 Greeks에 재사용
+        S, sigma, sqrtT = self._S, self._sigma, self._sqrtT
+        strike_pv = self._K * self._discount
+        pd1 = self._pd1
+
+        gamma = pd1 / (S * sigma * sqrtT)
+        vega = S * pd1 * sqrtT / 100
+        theta_decay = -(S * pd1 * sigma) / (2 * sqrtT)
+
         if option_type.lower() == 'call':
-            return {
-                'delta': self.call_delta(),
-                'gamma': self.gamma(),
-                'theta': self.call_theta(),
-                'theta_daily': self.call_theta() / 365,
-                'vega': self.vega(),
-                'rho': self.call_rho()
-            }
+            delta = self._nd1
+            theta = theta_decay - self._r * strike_pv * self._nd2
+            rho = self._T * strike_pv * self._nd2 / 100
         else:
-            return {
-                'delta': self.put_delta(),
-                'gamma': self.gamma(),
-                'theta': self.put_theta(),
-                'theta_daily': self.put_theta() / 365,
-                'vega': self.vega(),
-                'rho': self.put_rho()
-            }
+            nd2_neg = self._nd2_neg
+            delta = self._nd1 - 1
+            theta = theta_decay + self._r * strike_pv * nd2_neg
+            rho = -self._T * strike_pv * nd2_neg / 100
+
+        return Greeks(
+            delta=delta,
+            gamma=gamma,
+            theta=theta,
+            theta_daily=theta / 365,
+            vega=vega,
+            rho=rho
+        )
 
     def intrinsic_value(self, option_type: str = 'call') -> float:
         """
@@ -196,11 +302,11 @@ class BlackScholesModel:
             옵션의 내재가치
         """
         if option_type.lower() == 'call':
-            return max(0, self.S - self.K)
+            return max(0.0, self._S - self._K)
         else:
-            return max(0, self.K - self.S)
+            return max(0.0, self._K - self._S)
 
-    def time_value(self, option_type: str = 'call') -> float:
+    def time_value(self, option_type: str = 'call', price: Optional[float] = None) -> float:
         """
         시간가치 계산 (옵션 가격 - 내재가치)
 
@@ -208,6 +314,8 @@ class BlackScholesModel:
         ----------
         option_type : str
             'call' 또는 'put'
+        price : float, optional
+            이미 계산한 옵션 가격 (없으면 새로 계산)
 
         Returns
         -------
@@ -215,13 +323,105 @@ class BlackScholesModel:
             옵션의 시간가치
         """
         if option_type.lower() == 'call':
-            return self.call_price() - self.intrinsic_value('call')
+            if price is None:
+                price = self.call_price()
+            return price - self.intrinsic_value('call')
         else:
-            return self.put_price() - self.intrinsic_value('put')
+            if price is None:
+                price = self.put_price()
+            return price - self.intrinsic_value('put')
+
+    @classmethod
+    def greeks_grid(cls, S, K, T, r, sigma, greek: str = 'delta',
+                    option_type: str = 'call') -> np.ndarray:
+        """
+        격자 전체의 Greek 값을 NumPy 브로드캐스팅으로 한 번에 계산
+
+        셀마다 모델 객체를 만드는 대신 d1, d2를 배열로 계산합니다.
+        입력 검증은 하지 않습니다.
+
+        Parameters
+        ----------
+        S, K, T, r, sigma : float 또는 np.ndarray
+            Black-Scholes 파라미터 (서로 브로드캐스팅 가능해야 함,
+            예: S[None, :], sigma[:, None])
+        greek : str
+            'delta', 'gamma', 'theta', 'theta_daily', 'vega', 'rho'
+        option_type : str
+            'call' 또는 'put'
+
+        Returns
+        -------
+        np.ndarray
+            Greek 값 배열 (단위는 인스턴스 메서드와 동일)
+        """
+        from scipy.special import ndtr
+
+        S, K, T, r, sigma = (np.asarray(x, dtype=np.float64) for x in (S, K, T, r, sigma))
+        sqrtT = np.sqrt(T)
+        sig_sqrtT = sigma * sqrtT
+        d1 = (np.log(S / K) + r * T + 0.5 * sigma * sigma * T) / sig_sqrtT
+        d2 = d1 - sig_sqrtT
+        is_call = option_type.lower() == 'call'
+
+        def theta():
+            term1 = -(S * _npdf_array(d1) * sigma) / (2 * sqrtT)
+            if is_call:
+                return term1 - r * K * np.exp(-r * T) * ndtr(d2)
+            return term1 + r * K * np.exp(-r * T) * ndtr(-d2)
+
+        formulas = {
+            'delta': lambda: ndtr(d1) if is_call else ndtr(d1) - 1,
+            'gamma': lambda: _npdf_array(d1) / (S * sig_sqrtT),
+            'theta': theta,
+            'theta_daily': lambda: theta() / 365,
+            'vega': lambda: S * _npdf_array(d1) * sqrtT / 100,
+            'rho': lambda: (K * T * np.exp(-r * T) * ndtr(d2) / 100 if is_call
+                            else -K * T * np.exp(-r * T) * ndtr(-d2) / 100),
+        }
+
+        if greek.lower() not in formulas:
+            raise ValueError(f"지원하지 않는 Greek입니다: {greek}")
+
+        return formulas[greek.lower()]()
+
+    @classmethod
+    def price_greeks_batch(cls, S, K, T, r, sigma,
+                           option_type='call') -> Tuple[np.ndarray, ...]:
+        """
+        여러 옵션의 가격과 Greeks를 Numba 커널로 한 번에 계산
+
+        Parameters
+        ----------
+        S, K, T, r, sigma : float 또는 np.ndarray
+            Black-Scholes 파라미터 (서로 브로드캐스팅 가능해야 함)
+        option_type : str 또는 array_like
+            'call' 또는 'put' (옵션별로 지정 가능)
+
+        Returns
+        -------
+        tuple of np.ndarray
+            (price, delta, gamma, vega, theta, rho)
+        """
+        from ._bs_kernel import bs_price_greeks_batch
+
+        is_call = np.char.lower(np.asarray(option_type, dtype=str)) == 'call'
+        return bs_price_greeks_batch(S, K, T, r, sigma, is_call)
 
     def __repr__(self) -> str:
-        return (f"BlackScholesModel(S={self.S}, K={self.K}, T={self.T}, "
-                f"r={self.r}, sigma={self.sigma})")
+        return (f"BlackScholesModel(S={self._S}, K={self._K}, T={self._T}, "
+                f"r={self._r}, sigma={self._sigma})")
+
+
+@functools.lru_cache(maxsize=2048)
+def cached_bs_model(S: float, K: float, T: float, r: float, sigma: float) -> BlackScholesModel:
+    """
+    입력값별로 메모이제이션된 BlackScholesModel 반환
+
+    입력값(S, K, T, r, sigma)은 읽기 전용 속성이라 인스턴스를 바꿀 수 없으므로,
+    같은 입력에 대해 같은 인스턴스를 재사용합니다.
+    """
+    return BlackScholesModel(S, K, T, r, sigma)
 
 
 def calculate_implied_volatility(
@@ -263,10 +463,12 @@ def calculate_implied_volatility(
     ValueError
         수렴하지 않는 경우
     """
+    BlackScholesModel._validate(S, K, T, initial_sigma)
     sigma = initial_sigma
 
     for i in range(max_iterations):
-        bs = BlackScholesModel(S, K, T, r, sigma)
+        # 입력은 위에서 검증했고, sigma는 아래에서 양수로 유지됨
+        bs = BlackScholesModel.from_trusted(S, K, T, r, sigma)
 
         if option_type.lower() == 'call':
             price = bs.call_price()
@@ -291,6 +493,94 @@ def calculate_implied_volatility(
     raise ValueError(f"내재 변동성이 {max_iterations}회 반복 후에도 수렴하지 않았습니다.")
 
 
+def calculate_implied_volatility_vec(
+    market_prices,
+    S,
+    K,
+    T,
+    r,
+    option_types='call',
+    initial_sigma: float = 0.20,
+    max_iterations: int = 100,
+    tolerance: float = 1e-5
+) -> np.ndarray:
+    """
+    여러 옵션의 내재 변동성을 뉴턴-랩슨 방법으로 한 번에 계산
+
+    `calculate_implied_volatility`와 같은 반복식을 NumPy 배열 전체에 적용하며,
+    수렴한 항목은 이후 반복에서 제외합니다.
+
+    Parameters
+    ----------
+    market_prices : array_like
+        시장에서 관찰된 옵션 가격
+    S, K, T, r : float 또는 array_like
+        Black-Scholes 파라미터 (market_prices와 브로드캐스팅 가능해야 함)
+    option_types : str 또는 array_like
+        'call' 또는 'put' (옵션별로 지정 가능)
+    initial_sigma : float
+        초기 변동성 추정값
+    max_iterations : int
+        최대 반복 횟수
+    tolerance : float
+        수렴 기준
+
+    Returns
+    -------
+    np.ndarray
+        계산된 내재 변동성 (수렴하지 않았거나 Vega가 너무 작은 항목은 NaN)
+    """
+    from scipy.special import ndtr
+
+    market_prices = np.asarray(market_prices, dtype=np.float64)
+    shape = np.broadcast_shapes(market_prices.shape, *(np.shape(x) for x in (S, K, T, r, option_types)))
+    market_prices, S, K, T, r = (
+        np.broadcast_to(np.asarray(x, dtype=np.float64), shape).ravel()
+        for x in (market_prices, S, K, T, r)
+    )
+    is_call = np.broadcast_to(np.char.lower(np.asarray(option_types, dtype=str)) == 'call', shape).ravel()
+
+    # 반복과 무관한 항은 미리 계산
+    sqrtT = np.sqrt(T)
+    log_SK = np.log(S / K)
+    rT = r * T
+    half_T = 0.5 * T
+    strike_pv = K * np.exp(-r * T)
+
+    sigma = np.full(market_prices.size, initial_sigma, dtype=np.float64)
+    active = np.ones(market_prices.size, dtype=bool)
+    failed = np.zeros(market_prices.size, dtype=bool)
+
+    for _ in range(max_iterations):
+        idx = np.flatnonzero(active)
+        if idx.size == 0:
+            break
+
+        sig = sigma[idx]
+        sig_sqrtT = sig * sqrtT[idx]
+        d1 = (log_SK[idx] + rT[idx] + half_T[idx] * sig * sig) / sig_sqrtT
+        d2 = d1 - sig_sqrtT
+
+        call = S[idx] * ndtr(d1) - strike_pv[idx] * ndtr(d2)
+        # 풋 가격은 풋-콜 패리티로 계산
+        price = np.where(is_call[idx], call, call - S[idx] + strike_pv[idx])
+        vega = S[idx] * _npdf_array(d1) * sqrtT[idx]
+
+        price_diff = price - market_prices[idx]
+        converged = np.abs(price_diff) < tolerance
+        stalled = ~converged & (vega < 1e-10)
+        update = ~(converged | stalled)
+
+        # 변동성이 음수가 되지 않도록
+        sigma[idx[update]] = np.maximum(sig[update] - price_diff[update] / vega[update], 0.0001)
+
+        failed[idx[stalled]] = True
+        active[idx[converged | stalled]] = False
+
+    sigma[active | failed] = np.nan
+    return sigma.reshape(shape)
+
+
 if __name__ == "__main__":
     # 사용 예제
     print("=" * 70)
@@ -319,7 +609,7 @@ if __name__ == "__main__":
 
     print(f"\nGreeks (Call):")
     greeks = bs.get_all_greeks('call')
-    for greek_name, value in greeks.items():
+    for greek_name, value in greeks._asdict().items():
         print(f"  {greek_name.capitalize()}: {value:.4f}")
 
     print(f"\n가치 분해 (Call):")
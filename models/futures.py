@@ -4,7 +4,8 @@
 이 모듈은 이론적 선물 가격과 베이시스를 계산합니다.
 """
 
-import numpy as np
+import functools
+import math
 from typing import Dict
 
 
@@ -36,10 +37,32 @@ class FuturesModel:
         if T <= 0:
             raise ValueError("만기(T)는 0보다 커야 합니다.")
 
-        self.S = S
-        self.r = r
-        self.q = q
-        self.T = T
+        # 입력값은 읽기 전용 속성으로만 노출하므로 이론가격은 한 번만 계산
+        self._S = S
+        self._r = r
+        self._q = q
+        self._T = T
+        self._theo = S * math.exp((r - q) * T)
+
+    @property
+    def S(self) -> float:
+        """현물 가격 (읽기 전용)"""
+        return self._S
+
+    @property
+    def r(self) -> float:
+        """무위험 이자율 (읽기 전용)"""
+        return self._r
+
+    @property
+    def q(self) -> float:
+        """배당수익률 (읽기 전용)"""
+        return self._q
+
+    @property
+    def T(self) -> float:
+        """만기 (읽기 전용)"""
+        return self._T
 
     def theoretical_price(self) -> float:
         """
@@ -52,7 +75,7 @@ class FuturesModel:
         float
             이론적 선물 가격
         """
-        return self.S * np.exp((self.r - self.q) * self.T)
+        return self._theo
 
     def basis(self, futures_price: float) -> float:
         """
@@ -68,7 +91,7 @@ class FuturesModel:
         float
             베이시스
         """
-        return futures_price - self.S
+        return futures_price - self._S
 
     def arbitrage_profit(self, futures_price: float, transaction_cost: float = 0.0) -> Dict[str, float]:
         """
@@ -86,12 +109,12 @@ class FuturesModel:
         dict
             차익거래 분석 결과
         """
-        theo_price = self.theoretical_price()
+        theo_price = self._theo
         price_diff = futures_price - theo_price
 
         # 거래비용 고려
-        buy_spot_sell_futures = price_diff - (self.S * transaction_cost)
-        sell_spot_buy_futures = -price_diff - (self.S * transaction_cost)
+        buy_spot_sell_futures = price_diff - (self._S * transaction_cost)
+        sell_spot_buy_futures = -price_diff - (self._S * transaction_cost)
 
         result = {
             'theoretical_price': theo_price,
@@ -99,11 +122,44 @@ class FuturesModel:
             'price_difference': price_diff,
             'buy_spot_sell_futures_profit': buy_spot_sell_futures,
             'sell_spot_buy_futures_profit': sell_spot_buy_futures,
-            'arbitrage_opportunity': abs(price_diff) > (self.S * transaction_cost)
+            'arbitrage_opportunity': abs(price_diff) > (self._S * transaction_cost)
         }
 
         return result
 
+    def arbitrage_profit_vec(self, futures_prices, transaction_cost: float = 0.0) -> Dict:
+        """
+        여러 선물 가격에 대한 차익거래 기회 분석 (벡터화)
+
+        `arbitrage_profit`과 같은 계산을 가격 배열 전체에 한 번에 적용합니다.
+
+        Parameters
+        ----------
+        futures_prices : array_like
+            선물 시장 가격 배열
+        transaction_cost : float
+            거래비용 (%, 소수점)
+
+        Returns
+        -------
+        dict
+            항목별 차익거래 분석 결과 배열
+        """
+        import numpy as np
+
+        futures_prices = np.asarray(futures_prices, dtype=np.float64)
+        price_diff = futures_prices - self._theo
+        cost = self._S * transaction_cost
+
+        return {
+            'theoretical_price': self._theo,
+            'market_price': futures_prices,
+            'price_difference': price_diff,
+            'buy_spot_sell_futures_profit': price_diff - cost,
+            'sell_spot_buy_futures_profit': -price_diff - cost,
+            'arbitrage_opportunity': np.abs(price_diff) > cost
+        }
+
     def hedge_ratio(self, portfolio_beta: float = 1.0) -> float:
         """
         헷지 비율 계산
@@ -121,7 +177,18 @@ class FuturesModel:
         return portfolio_beta
 
     def __repr__(self) -> str:
-        return f"FuturesModel(S={self.S}, r={self.r}, q={self.q}, T={self.T})"
+        return f"FuturesModel(S={self._S}, r={self._r}, q={self._q}, T={self._T})"
+
+
+@functools.lru_cache(maxsize=2048)
+def cached_futures_model(S: float, r: float, q: float = 0.0, T: float = 0.25) -> FuturesModel:
+    """
+    입력값별로 메모이제이션된 FuturesModel 반환
+
+    입력값(S, r, q, T)은 읽기 전용 속성이라 인스턴스를 바꿀 수 없으므로,
+    같은 입력에 대해 같은 인스턴스를 재사용합니다.
+    """
+    return FuturesModel(S, r, q, T)
 
 
 if __name__ == "__main__":
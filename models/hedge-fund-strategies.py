@@ -8,8 +8,9 @@
 - Leverage: 레버리지 효과 분석
 """
 
+import functools
 import numpy as np
-from typing import Dict, List
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
 import pandas as pd
 
 
@@ -59,6 +60,121 @@ class HedgeFundStrategy:
         return total_cost
 
 
+class PositionsValue(NamedTuple):
+    """롱/숏 포지션 가치 및 손익 (ret: 초기 자본 대비 수익률)"""
+    long_value: float
+    short_value: float
+    net_value: float
+    long_pnl: float
+    short_pnl: float
+    total_pnl: float
+    ret: float
+
+
+class _PositionBook:
+    """
+    한쪽(롱 또는 숏) 포지션 보관소
+
+    진입가격과 수량을 float64 병렬 배열(SoA)로 저장하고,
+    용량이 차면 두 배로 늘립니다 (분할 상환 O(1) 추가).
+    """
+
+    _INITIAL_CAPACITY = 16
+
+    def __init__(self):
+        self.symbols: List[str] = []
+        self.index: Dict[str, int] = {}
+        self._n = 0
+        self._entry_prices = np.empty(self._INITIAL_CAPACITY, dtype=np.float64)
+        self._quantities = np.empty(self._INITIAL_CAPACITY, dtype=np.float64)
+        # 현재가격과 가격 존재 여부 (포지션과 같은 인덱스)
+        self._prices = np.zeros(self._INITIAL_CAPACITY, dtype=np.float64)
+        self._priced = np.zeros(self._INITIAL_CAPACITY, dtype=bool)
+        # 진입 금액 합계 (포지션 변경 시 함께 갱신)
+        self._entry_total = 0.0
+
+    @property
+    def entry_prices(self) -> np.ndarray:
+        return self._entry_prices[:self._n]
+
+    @property
+    def quantities(self) -> np.ndarray:
+        return self._quantities[:self._n]
+
+    def add(self, symbol: str, price: float, quantity: int):
+        """포지션 추가 (같은 종목이면 덮어씀)"""
+        i = self.index.get(symbol)
+        if i is None:
+            i = self._n
+            if i == self._entry_prices.size:
+                capacity = 2 * i
+                self._entry_prices = np.resize(self._entry_prices, capacity)
+                self._quantities = np.resize(self._quantities, capacity)
+                self._prices = np.resize(self._prices, capacity)
+                self._priced = np.resize(self._priced, capacity)
+            self.index[symbol] = i
+            self.symbols.append(symbol)
+            self._prices[i] = 0.0
+            self._priced[i] = False
+            self._n += 1
+        else:
+            self._entry_total -= float(self._entry_prices[i] * self._quantities[i])
+        self._entry_prices[i] = price
+        self._quantities[i] = quantity
+        self._entry_total += price * quantity
+
+    def holdings(self) -> Dict[str, Dict]:
+        """{'symbol': {'entry_price', 'quantity', 'entry_value'}} 형태로 변환"""
+        return {
+            symbol: {
+                'entry_price': price,
+                'quantity': quantity,
+                'entry_value': price * quantity
+            }
+            for symbol, price, quantity in zip(self.symbols,
+                                               self.entry_prices.tolist(),
+                                               self.quantities.tolist())
+        }
+
+    def entry_total(self) -> float:
+        """진입 금액 합계"""
+        return self._entry_total
+
+    def set_prices(self, prices: np.ndarray, priced: Optional[np.ndarray] = None):
+        """
+        현재가격 벡터 설정 (포지션 추가 순서와 같은 인덱스)
+
+        priced가 False인 종목은 가격이 없는 것으로 보고 계산에서 제외합니다.
+        """
+        n = self._n
+        prices = np.asarray(prices, dtype=np.float64)
+        if prices.shape != (n,):
+            raise ValueError(f"가격 벡터 길이({prices.size})가 포지션 수({n})와 다릅니다.")
+        if priced is None:
+            self._prices[:n] = prices
+            self._priced[:n] = True
+        else:
+            # 가격이 없는 자리에 NaN 등이 들어 있어도 0 × NaN = NaN이 되지 않도록 0으로 채움
+            priced = np.asarray(priced, dtype=bool)
+            self._prices[:n] = np.where(priced, prices, 0.0)
+            self._priced[:n] = priced
+
+    def set_prices_from_dict(self, prices: Dict[str, float]):
+        """{'symbol': current_price} 형태의 현재가격 설정"""
+        n = self._n
+        self._prices[:n] = np.fromiter((prices.get(s, 0.0) for s in self.symbols), dtype=np.float64, count=n)
+        self._priced[:n] = np.fromiter((s in prices for s in self.symbols), dtype=bool, count=n)
+
+    def marked_arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        (수량, 진입가격, 현재가격) 배열 반환
+
+        현재가격이 없는 종목은 수량을 0으로 두어 계산에서 제외합니다.
+        """
+        n = self._n
+        return self.quantities * self._priced[:n], self.entry_prices, self._prices[:n]
+
+
 class LongShortStrategy(HedgeFundStrategy):
     """
     롱/숏 전략
@@ -70,74 +186,99 @@ class LongShortStrategy(HedgeFundStrategy):
                  borrowing_rate: float = 0.03, short_rebate_rate: float = 0.01):
         super().__init__(initial_capital, leverage_ratio, borrowing_rate)
         self.short_rebate_rate = short_rebate_rate
-        self.long_holdings = {}
-        self.short_holdings = {}
+        self._long = _PositionBook()
+        self._short = _PositionBook()
+
+    @property
+    def long_holdings(self) -> Dict[str, Dict]:
+        """롱 포지션 내역 {'symbol': {'entry_price', 'quantity', 'entry_value'}}"""
+        return self._long.holdings()
+
+    @property
+    def short_holdings(self) -> Dict[str, Dict]:
+        """숏 포지션 내역 {'symbol': {'entry_price', 'quantity', 'entry_value'}}"""
+        return self._short.holdings()
     
     def add_long_position(self, symbol: str, price: float, quantity: int):
         """롱 포지션 추가 - 기초자산 매수"""
-        self.long_holdings[symbol] = {
-            'entry_price': price,
-            'quantity': quantity,
-            'entry_value': price * quantity
-        }
+        self._long.add(symbol, price, quantity)
     
     def add_short_position(self, symbol: str, price: float, quantity: int):
         """숏 포지션 추가 - 기초자산 공매도"""
-        self.short_holdings[symbol] = {
-            'entry_price': price,
-            'quantity': quantity,
-            'entry_value': price * quantity
-        }
+        self._short.add(symbol, price, quantity)
+    
+    @property
+    def long_symbols(self) -> List[str]:
+        """롱 포지션 종목 (가격 벡터의 인덱스 순서)"""
+        return list(self._long.symbols)
+
+    @property
+    def short_symbols(self) -> List[str]:
+        """숏 포지션 종목 (가격 벡터의 인덱스 순서)"""
+        return list(self._short.symbols)
+    
+    def update_prices(self, long_prices: np.ndarray, short_prices: np.ndarray,
+                      long_priced: Optional[np.ndarray] = None,
+                      short_priced: Optional[np.ndarray] = None):
+        """
+        현재가격 벡터 갱신
+        
+        Parameters
+        ----------
+        long_prices, short_prices : np.ndarray
+            `long_symbols` / `short_symbols` 순서의 현재가격
+        long_priced, short_priced : np.ndarray of bool, optional
+            가격 존재 여부 (False인 종목은 계산에서 제외, 기본값: 모두 True)
+        """
+        self._long.set_prices(long_prices, long_priced)
+        self._short.set_prices(short_prices, short_priced)
     
-    def calculate_positions_value(self, long_prices: Dict[str, float], 
-                                 short_prices: Dict[str, float]) -> Dict:
+    def calculate_positions_value(self, long_prices: Optional[Dict[str, float]] = None,
+                                 short_prices: Optional[Dict[str, float]] = None) -> PositionsValue:
         """
         현재 포지션 가치 계산
         
         Parameters
         ----------
-        long_prices : dict
-            {'symbol': current_price}
-        short_prices : dict
-            {'symbol': current_price}
+        long_prices : dict, optional
+            {'symbol': current_price} (생략 시 `update_prices`로 설정한 가격 사용)
+        short_prices : dict, optional
+            {'symbol': current_price} (생략 시 `update_prices`로 설정한 가격 사용)
         
         Returns
         -------
-        dict
-            현재 가치 및 손익 분석
+        PositionsValue
+            현재 가치 및 손익 분석 (튜플이므로 백테스트 시 `out[i] = result`로
+            (N, 7) 결과 배열에 바로 기록할 수 있음)
         """
+        if long_prices is not None:
+            self._long.set_prices_from_dict(long_prices)
+        if short_prices is not None:
+            self._short.set_prices_from_dict(short_prices)
+        
         # 롱 포지션 계산
-        long_value = 0
-        long_pnl = 0
-        for symbol, holding in self.long_holdings.items():
-            if symbol in long_prices:
-                current_value = long_prices[symbol] * holding['quantity']
-                pnl = current_value - holding['entry_value']
-                long_value += current_value
-                long_pnl += pnl
+        quantities, entry_prices, current_prices = self._long.marked_arrays()
+        long_value = float(np.vdot(quantities, current_prices))
+        long_pnl = float(np.vdot(quantities, current_prices - entry_prices))
         
         # 숏 포지션 계산
-        short_value = 0
-        short_pnl = 0
-        for symbol, holding in self.short_holdings.items():
-            if symbol in short_prices:
-                current_price = short_prices[symbol]
-                # 숏 포지션: 진입 가격이 낮을수록 수익
-                short_pnl += (holding['entry_price'] - current_price) * holding['quantity']
-                short_value -= current_price * holding['quantity']
+        quantities, entry_prices, current_prices = self._short.marked_arrays()
+        # 숏 포지션: 진입 가격이 낮을수록 수익
+        short_pnl = float(np.vdot(quantities, entry_prices - current_prices))
+        short_value = -float(np.vdot(quantities, current_prices))
         
         net_value = long_value + short_value
         total_pnl = long_pnl + short_pnl
         
-        return {
-            'long_value': long_value,
-            'short_value': short_value,
-            'net_value': net_value,
-            'long_pnl': long_pnl,
-            'short_pnl': short_pnl,
-            'total_pnl': total_pnl,
-            'return': total_pnl / self.initial_capital if self.initial_capital > 0 else 0
-        }
+        return PositionsValue(
+            long_value=long_value,
+            short_value=short_value,
+            net_value=net_value,
+            long_pnl=long_pnl,
+            short_pnl=short_pnl,
+            total_pnl=total_pnl,
+            ret=total_pnl / self.initial_capital if self.initial_capital > 0 else 0
+        )
     
     def calculate_market_exposure(self) -> Dict:
         """
@@ -145,8 +286,8 @@ class LongShortStrategy(HedgeFundStrategy):
         
         시장 중립 전략이 얼마나 성공했는지 분석
         """
-        long_value = sum(h['entry_value'] for h in self.long_holdings.values())
-        short_value = sum(h['entry_value'] for h in self.short_holdings.values())
+        long_value = self._long.entry_total()
+        short_value = self._short.entry_total()
         
         gross_value = long_value + short_value
         net_value = long_value - short_value
@@ -162,6 +303,33 @@ class LongShortStrategy(HedgeFundStrategy):
             'market_neutral_ratio': market_neutral,
             'is_market_neutral': market_neutral < 0.1
         }
+    
+    @staticmethod
+    def classify_exposure(net_values, gross_values,
+                          threshold: float = 0.1) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        여러 전략의 시장 중립 여부를 한 번에 판정
+        
+        Parameters
+        ----------
+        net_values : array_like
+            전략별 순 노출도
+        gross_values : array_like
+            전략별 총 노출도
+        threshold : float
+            시장 중립으로 볼 |순 노출도| / 총 노출도의 상한
+        
+        Returns
+        -------
+        tuple of np.ndarray
+            (시장 중립도, 시장 중립 여부)
+        """
+        net_values = np.asarray(net_values, dtype=np.float64)
+        gross_values = np.asarray(gross_values, dtype=np.float64)
+        
+        # 총 노출도가 0이면 순 노출도도 0이므로 중립도 0
+        ratio = np.abs(net_values) / np.maximum(gross_values, 1e-12)
+        return ratio, ratio < threshold
 
 
 class PairsTrading(HedgeFundStrategy):
@@ -188,25 +356,41 @@ class PairsTrading(HedgeFundStrategy):
             'correlation': correlation
         })
     
-    def calculate_spread(self, long_price: float, short_price: float,
-                        historical_mean: float, historical_std: float) -> Dict:
+    def calculate_spread(self, long_price, short_price,
+                        historical_mean, historical_std) -> Dict:
         """
         스프레드 계산
         
         Z-Score를 통해 평균 회귀 기회를 찾음
         Z = (현재값 - 평균) / 표준편차
+        
+        가격 시계열(np.ndarray)을 넣으면 시점별 결과 배열을 반환하고,
+        스칼라를 넣으면 스칼라 결과를 반환합니다.
+        표준편차가 0 이하인 시점의 Z-Score는 0입니다.
         """
-        current_spread = long_price - short_price
-        z_score = (current_spread - historical_mean) / historical_std if historical_std > 0 else 0
+        current_spread = np.subtract(long_price, short_price, dtype=np.float64)
+        deviation = current_spread - np.asarray(historical_mean, dtype=np.float64)
+        historical_std = np.asarray(historical_std, dtype=np.float64)
         
-        return {
+        z_score = np.divide(deviation, historical_std,
+                            out=np.zeros(np.broadcast(deviation, historical_std).shape),
+                            where=historical_std > 0)
+        
+        result = {
             'current_spread': current_spread,
             'historical_mean': historical_mean,
             'z_score': z_score,
             'is_overvalued': z_score > 2,
             'is_undervalued': z_score < -2,
-            'mean_reversion_opportunity': abs(z_score) > 2
+            'mean_reversion_opportunity': np.abs(z_score) > 2
         }
+        
+        if z_score.ndim == 0:
+            # 스칼라 입력이면 Python 스칼라로 반환
+            return {key: value.item() if isinstance(value, (np.ndarray, np.generic)) else value
+                    for key, value in result.items()}
+        
+        return result
 
 
 class Leverage:
@@ -238,41 +422,75 @@ class Leverage:
         float
             레버리지 적용 후 수익률
         """
-        # 차입 이자 비용
-        daily_rate = borrowing_rate / 365
-        borrowed_portion = leverage_ratio - 1.0
-        borrowing_cost = borrowed_portion * daily_rate * holding_days
+        # 차입 조건이 배열일 수도 있으므로 캐시를 거치지 않고 바로 계산
+        borrowing_cost_per_unit = borrowing_rate / 365 * holding_days
+        return (unleveraged_return * leverage_ratio
+                - (leverage_ratio - 1.0) * borrowing_cost_per_unit)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def leveraged_return_function(borrowing_rate: float,
+                                  holding_days: int) -> Callable:
+        """
+        차입 조건이 고정된 레버리지 수익률 함수 생성
+        
+        (borrowing_rate, holding_days)가 같은 시나리오를 반복 계산할 때,
+        단위 레버리지당 차입 비용을 미리 계산해 둔 함수를 반환합니다.
+        반환된 함수는 NumPy 배열 입력도 그대로 받습니다.
+        
+        결과가 캐시되므로 `borrowing_rate`와 `holding_days`는 해시 가능한
+        스칼라여야 합니다. 배열 차입 조건은 `calculate_leveraged_return`을
+        사용하세요.
+        
+        Returns
+        -------
+        callable
+            f(unleveraged_return, leverage_ratio) -> 레버리지 적용 후 수익률
+        """
+        # 차입 이자 비용 (차입 비율 1단위당)
+        borrowing_cost_per_unit = borrowing_rate / 365 * holding_days
         
-        # 레버리지 수익 = 언레버리지 수익 × 레버리지 - 차입 비용
-        leveraged_return = unleveraged_return * leverage_ratio - borrowing_cost
+        def leveraged_return(unleveraged_return, leverage_ratio):
+            # 레버리지 수익 = 언레버리지 수익 × 레버리지 - 차입 비용
+            return (unleveraged_return * leverage_ratio
+                    - (leverage_ratio - 1.0) * borrowing_cost_per_unit)
         
         return leveraged_return
     
     @staticmethod
-    def margin_call_price(entry_price: float, leverage_ratio: float,
-                         margin_requirement: float = 0.30) -> float:
+    def margin_call_price(entry_price, leverage_ratio, margin_requirement=0.30,
+                          out: Optional[np.ndarray] = None):
         """
         마진 콜 가격 계산
         
+        모든 인자는 스칼라 또는 서로 브로드캐스팅 가능한 배열입니다.
+        (예: `np.ix_(prices, leverages)`로 가격 × 레버리지 그리드 계산)
+        
         Parameters
         ----------
-        entry_price : float
+        entry_price : float or array_like
             진입 가격
-        leverage_ratio : float
+        leverage_ratio : float or array_like
             레버리지 배율
-        margin_requirement : float
+        margin_requirement : float or array_like
             유지 마진율 (기본값 30%)
+        out : np.ndarray, optional
+            결과를 기록할 배열
         
         Returns
         -------
-        float
+        float or np.ndarray
             마진 콜이 발생하는 가격
         """
-        max_loss = 1 - margin_requirement
-        price_decline_pct = max_loss / leverage_ratio
-        margin_call_price = entry_price * (1 - price_decline_pct)
+        max_loss = 1.0 - np.asarray(margin_requirement, dtype=np.float64)
+        price_decline_pct = max_loss / np.asarray(leverage_ratio, dtype=np.float64)
         
-        return margin_call_price
+        result = np.multiply(entry_price, 1.0 - price_decline_pct, out=out)
+        
+        # 스칼라 입력이면 Python float으로 반환
+        if out is None and result.ndim == 0:
+            return result.item()
+        return result
     
     @staticmethod
     def leverage_scenarios(initial_investment: float, price_change_pct: float,
@@ -287,25 +505,21 @@ class Leverage:
         pd.DataFrame
             다양한 레버리지 배율에 따른 수익률 비교
         """
-        scenarios = []
-        
-        for leverage in leverage_ratios:
-            borrowed_amount = initial_investment * (leverage - 1)
-            borrowing_cost = borrowed_amount * borrowing_rate / 365 * holding_days
-            
-            gross_profit = initial_investment * leverage * price_change_pct
-            net_profit = gross_profit - borrowing_cost
-            net_return = net_profit / initial_investment
-            
-            scenarios.append({
-                'leverage': leverage,
-                'gross_profit': gross_profit,
-                'borrowing_cost': borrowing_cost,
-                'net_profit': net_profit,
-                'net_return': net_return
-            })
-        
-        return pd.DataFrame(scenarios)
+        leverage = np.asarray(leverage_ratios, dtype=np.float64)
+        borrowed_amount = initial_investment * (leverage - 1)
+        borrowing_cost = borrowed_amount * borrowing_rate / 365 * holding_days
+        
+        gross_profit = initial_investment * leverage * price_change_pct
+        net_profit = gross_profit - borrowing_cost
+        net_return = net_profit / initial_investment
+        
+        return pd.DataFrame({
+            'leverage': leverage,
+            'gross_profit': gross_profit,
+            'borrowing_cost': borrowing_cost,
+            'net_profit': net_profit,
+            'net_return': net_return
+        })
 
 
 # 사용 예제
@@ -336,10 +550,10 @@ if __name__ == "__main__":
     
     result = ls_strategy.calculate_positions_value(current_prices_long, current_prices_short)
     print(f"\n포트폴리오 가치:")
-    print(f"  롱 포지션 손익: ${result['long_pnl']:,.2f}")
-    print(f"  숏 포지션 손익: ${result['short_pnl']:,.2f}")
-    print(f"  총 손익: ${result['total_pnl']:,.2f}")
-    print(f"  수익률: {result['return']*100:.2f}%")
+    print(f"  롱 포지션 손익: ${result.long_pnl:,.2f}")
+    print(f"  숏 포지션 손익: ${result.short_pnl:,.2f}")
+    print(f"  총 손익: ${result.total_pnl:,.2f}")
+    print(f"  수익률: {result.ret*100:.2f}%")
     
     # 시장 노출도
     exposure = ls_strategy.calculate_market_exposure()
@@ -8,9 +8,142 @@ LBO (Leveraged Buyout) 모델링 및 사모펀드 수익률 분석
 - 현금흐름 분석
 """
 
+import functools
 import numpy as np
 from typing import Dict, List
 import pandas as pd
+from numba import guvectorize, njit
+
+
+# DCF/LBO 요약 공통 가정 (generate_summary와 screen_deals가 함께 사용)
+TAX_RATE = 0.25
+CAPEX_PCT = 0.05
+EXIT_DEBT_RATIO = 0.6  # 출구 시점 잔존 부채 비율
+
+
+def _cents(amount: float) -> int:
+    """달러 금액을 정수 센트로 변환"""
+    return int(round(amount * 100))
+
+
+@njit
+def _debt_schedule(debt, rate, repayment, term):
+    """
+    연도별 부채 상환 계산 (Numba)
+
+    Returns
+    -------
+    tuple of np.ndarray
+        (기초 부채, 이자비용, 원금상환액, 기말 부채, 상환액 부족 여부)
+    """
+    beginning = np.empty(term)
+    interest = np.empty(term)
+    principal = np.empty(term)
+    ending = np.empty(term)
+    shortfall = np.zeros(term, dtype=np.bool_)
+
+    remaining = debt
+    for year in range(term):
+        interest_expense = remaining * rate
+        principal_repayment = repayment - interest_expense
+
+        if principal_repayment < 0:
+            shortfall[year] = True
+            principal_repayment = 0.0
+        elif principal_repayment > remaining:
+            principal_repayment = remaining
+
+        beginning[year] = remaining
+        interest[year] = interest_expense
+        principal[year] = principal_repayment
+        remaining -= principal_repayment
+        ending[year] = remaining
+
+    return beginning, interest, principal, ending, shortfall
+
+
+@njit
+def _irr(cash_flows, guess=0.1, tolerance=1e-7, max_iterations=50):
+    """
+    NPV = 0이 되는 할인율을 뉴턴-랩슨 방법으로 계산 (Numba)
+
+    수렴하지 않으면 NaN을 반환합니다.
+    """
+    rate = guess
+    periods = np.arange(cash_flows.size)
+
+    for _ in range(max_iterations):
+        discount = (1.0 + rate) ** periods
+        npv = np.sum(cash_flows / discount)
+        d_npv = -np.sum(periods * cash_flows / (discount * (1.0 + rate)))
+
+        if d_npv == 0.0:
+            return np.nan
+
+        step = npv / d_npv
+        new_rate = rate - step
+
+        # 할인율이 -100% 이하로 넘어가면 NPV가 정의되지 않으므로 -1 쪽으로 절반만 이동
+        if new_rate <= -1.0:
+            new_rate = 0.5 * (rate - 1.0)
+
+        if abs(new_rate - rate) < tolerance:
+            return new_rate
+        rate = new_rate
+
+    return np.nan
+
+
+@njit
+def _npv_horner(fcf, wacc, terminal_value):
+    """
+    연말 현금흐름과 마지막 해 터미널 가치의 현재가치 (호너 방식, Numba)
+
+    (1+WACC)^t 거듭제곱 없이 나눗셈만으로 할인합니다.
+    """
+    if fcf.size == 0:
+        return terminal_value
+    d = 1.0 + wacc
+    acc = (fcf[-1] + terminal_value) / d
+    for i in range(fcf.size - 2, -1, -1):
+        acc = (acc + fcf[i]) / d
+    return acc
+
+
+def _summarize_deal_kernel(initial_ebitda, wacc, growth_rate, exit_multiple, equity, debt,
+                           years, exit_ev, equity_proceeds, moic):
+    """
+    거래 하나의 출구 가치, 자본 회수액, MOIC 계산 (`_summarize_deal` gufunc 본체)
+
+    `LBOAnalysisSummary.generate_summary`와 같은 가정(TAX_RATE, CAPEX_PCT,
+    EXIT_DEBT_RATIO)을 사용합니다.
+    """
+    fcf_factor = initial_ebitda * ((1 - TAX_RATE) - CAPEX_PCT)
+    growth = 1.0
+    discount = 1.0
+    pv_fcf = 0.0
+    for _ in range(years):
+        growth *= 1.0 + growth_rate
+        discount *= 1.0 + wacc
+        pv_fcf += fcf_factor * growth / discount
+
+    terminal_value = initial_ebitda * growth * exit_multiple
+    exit_ev[0] = pv_fcf + terminal_value / discount
+    equity_proceeds[0] = exit_ev[0] - debt * EXIT_DEBT_RATIO
+    moic[0] = equity_proceeds[0] / equity if equity > 0 else 0.0
+
+
+@functools.lru_cache(maxsize=None)
+def _summarize_deal():
+    """
+    병렬 gufunc 컴파일 (첫 `screen_deals` 호출 시 한 번)
+
+    시그니처를 지정한 guvectorize는 즉시 컴파일되므로(약 0.4초),
+    모듈 import 시점이 아니라 처음 필요할 때 만듭니다.
+    """
+    return guvectorize(['void(f8, f8, f8, f8, f8, f8, i8, f8[:], f8[:], f8[:])'],
+                       '(),(),(),(),(),(),()->(),(),()',
+                       target='parallel')(_summarize_deal_kernel)
 
 
 class DCFValuation:
@@ -50,26 +183,36 @@ class DCFValuation:
         np.ndarray
             예측 EBITDA
         """
-        ebitdas = []
-        for i in range(years):
-            ebitda = self.initial_ebitda * ((1 + growth_rate) ** (i + 1))
-            ebitdas.append(ebitda)
-        
-        return np.array(ebitdas)
+        growth = np.power(1.0 + growth_rate, np.arange(1, years + 1, dtype=np.float64))
+        return self.initial_ebitda * growth
     
-    def calculate_fcf(self, ebitda: np.ndarray, tax_rate: float = 0.25,
-                     capex_pct: float = 0.05, nwc_change: float = 0) -> np.ndarray:
+    def calculate_fcf(self, ebitda: np.ndarray, tax_rate: float = TAX_RATE,
+                     capex_pct: float = CAPEX_PCT, nwc_change: float = 0) -> np.ndarray:
         """
         자유현금흐름(FCF) 계산
         
         FCF = EBITDA × (1 - 세율) - CapEx - NWC 변화
         """
-        ebit = ebitda  # 간단히, D&A = 0으로 가정
-        nopat = ebit * (1 - tax_rate)
-        capex = ebitda * capex_pct
-        fcf = nopat - capex - nwc_change
+        # 간단히 D&A = 0으로 가정하면 EBIT = EBITDA이므로
+        # FCF = EBITDA × ((1 - 세율) - CapEx 비율) - NWC 변화
+        return ebitda * ((1 - tax_rate) - capex_pct) - nwc_change
+    
+    def project_fcf(self, years: int, growth_rate: float, tax_rate: float = TAX_RATE,
+                    capex_pct: float = CAPEX_PCT, nwc_change: float = 0) -> np.ndarray:
+        """
+        예측 기간의 자유현금흐름(FCF)을 한 번에 계산
+        
+        `calculate_fcf(project_cash_flows(years, growth_rate))`와 같은 결과를
+        중간 EBITDA 배열 없이 계산합니다.
         
-        return fcf
+        Returns
+        -------
+        np.ndarray
+            예측 FCF
+        """
+        growth = np.power(1.0 + growth_rate, np.arange(1, years + 1, dtype=np.float64))
+        fcf_factor = self.initial_ebitda * ((1 - tax_rate) - capex_pct)
+        return fcf_factor * growth - nwc_change
     
     def calculate_terminal_value(self, final_ebitda: float, 
                                 exit_multiple: float = 7.0) -> float:
@@ -95,12 +238,7 @@ class DCFValuation:
         """
         기업가치(Enterprise Value) 계산
         """
-        pv_fcf = sum(fcf[i] / (1 + self.wacc) ** (i + 1) for i in range(len(fcf)))
-        pv_terminal = terminal_value / (1 + self.wacc) ** len(fcf)
-        
-        enterprise_value = pv_fcf + pv_terminal
-        
-        return enterprise_value
+        return float(_npv_horner(np.asarray(fcf, dtype=np.float64), self.wacc, terminal_value))
 
 
 class LBOModel:
@@ -133,8 +271,8 @@ class LBOModel:
         self.interest_rate = interest_rate
         self.loan_term = loan_term
         
-        # 검증
-        if abs((equity_contribution + debt_amount) - purchase_price) > 1:
+        # 검증 (센트 단위 정수로 비교하여 부동소수점 오차 없이 일치 확인)
+        if _cents(equity_contribution + debt_amount) != _cents(purchase_price):
             raise ValueError("자본 + 부채 = 인수 가격이어야 합니다.")
     
     def get_capital_structure(self) -> Dict:
@@ -150,6 +288,39 @@ class LBOModel:
             'debt_to_equity': self.debt_amount / self.equity_contribution if self.equity_contribution > 0 else 0
         }
     
+    def calculate_debt_schedule_arrays(self, annual_repayment: float) -> Dict[str, np.ndarray]:
+        """
+        부채 상환 일정 계산 (열별 배열)
+        
+        DataFrame을 만들지 않으므로 상환액을 바꿔가며 반복 계산할 때 사용합니다.
+        
+        Parameters
+        ----------
+        annual_repayment : float
+            연간 상환액
+        
+        Returns
+        -------
+        dict
+            {'year', 'beginning_debt', 'interest_expense',
+             'principal_repayment', 'ending_debt'} 열 배열
+        """
+        beginning, interest, principal, ending, shortfall = _debt_schedule(
+            float(self.debt_amount), float(self.interest_rate),
+            float(annual_repayment), int(self.loan_term)
+        )
+        
+        if shortfall.any():
+            print("경고: 상환액이 이자보다 작습니다.")
+        
+        return {
+            'year': np.arange(1, self.loan_term + 1),
+            'beginning_debt': beginning,
+            'interest_expense': interest,
+            'principal_repayment': principal,
+            'ending_debt': ending
+        }
+    
     def calculate_debt_schedule(self, annual_repayment: float) -> pd.DataFrame:
         """
         부채 상환 일정 계산
@@ -164,28 +335,7 @@ class LBOModel:
         pd.DataFrame
             부채 상환 일정
         """
-        schedule = []
-        remaining_debt = self.debt_amount
-        
-        for year in range(self.loan_term):
-            interest_expense = remaining_debt * self.interest_rate
-            principal_repayment = min(annual_repayment - interest_expense, remaining_debt)
-            
-            if principal_repayment < 0:
-                print("경고: 상환액이 이자보다 작습니다.")
-                principal_repayment = 0
-            
-            remaining_debt -= principal_repayment
-            
-            schedule.append({
-                'year': year + 1,
-                'beginning_debt': remaining_debt + principal_repayment,
-                'interest_expense': interest_expense,
-                'principal_repayment': principal_repayment,
-                'ending_debt': remaining_debt
-            })
-        
-        return pd.DataFrame(schedule)
+        return pd.DataFrame(self.calculate_debt_schedule_arrays(annual_repayment))
     
     def calculate_exit_proceeds(self, exit_enterprise_value: float, 
                                remaining_debt: float, transaction_costs: float = 0) -> Dict:
@@ -240,19 +390,16 @@ class PrivateEquityMetrics:
         float
             IRR
         """
-        from numpy_financial import irr
-        
-        # 연도별로 정렬하여 현금흐름 배열 생성
-        years = sorted(cash_flows.keys())
-        max_year = max(years)
+        n = len(cash_flows)
+        years = np.fromiter(cash_flows.keys(), dtype=np.int64, count=n)
+        values = np.fromiter(cash_flows.values(), dtype=np.float64, count=n)
         
-        # 0에서 max_year까지의 모든 연도에 대해 배열 생성
-        cf_array = [0] * (max_year + 1)
-        for year, cf in cash_flows.items():
-            cf_array[year] = cf
+        # 0에서 max_year까지의 모든 연도에 대해 배열 생성 (빈 연도는 0)
+        cf_array = np.zeros(years.max() + 1)
+        cf_array[years] = values
         
         # IRR 계산
-        return float(irr(cf_array))
+        return float(_irr(cf_array))
     
     @staticmethod
     def calculate_moic(invested_capital: float, proceeds: float) -> float:
@@ -315,18 +462,18 @@ class LBOAnalysisSummary:
         structure = lbo_model.get_capital_structure()
         
         # 현금흐름 예측 (5년)
-        ebitdas = dcf_model.project_cash_flows(5, revenue_growth)
-        fcf = dcf_model.calculate_fcf(ebitdas)
+        years = 5
+        fcf = dcf_model.project_fcf(years, revenue_growth)
         
         # 터미널 값
-        final_ebitda = ebitdas[-1]
+        final_ebitda = dcf_model.initial_ebitda * (1.0 + revenue_growth) ** years
         terminal_value = dcf_model.calculate_terminal_value(final_ebitda, exit_multiple)
         
         # 기업 가치
         enterprise_value = dcf_model.calculate_enterprise_value(fcf, terminal_value)
         
         # 출구 수익
-        remaining_debt = lbo_model.debt_amount * 0.6  # 대략 60% 남아있다고 가정
+        remaining_debt = lbo_model.debt_amount * EXIT_DEBT_RATIO  # 대략 60% 남아있다고 가정
         exit_proceeds = lbo_model.calculate_exit_proceeds(enterprise_value, remaining_debt)
         
         # 수익률
@@ -347,6 +494,54 @@ class LBOAnalysisSummary:
             'total_cash_generated': exit_proceeds['equity_proceeds'],
             'leverage_multiple': structure['debt_to_equity']
         }
+    
+    @staticmethod
+    def screen_deals(initial_ebitda, wacc, revenue_growth, exit_multiple,
+                     equity_contribution, debt_amount, years: int = 5) -> Dict:
+        """
+        여러 후보 거래의 요약 지표를 한 번에 계산
+        
+        `generate_summary`의 수치 계산 부분을 거래 단위로 병렬 계산합니다.
+        각 인자는 스칼라 또는 서로 브로드캐스팅 가능한 배열입니다.
+        
+        Parameters
+        ----------
+        initial_ebitda : array_like
+            초기 EBITDA
+        wacc : array_like
+            가중평균자본비용
+        revenue_growth : array_like
+            연간 성장률
+        exit_multiple : array_like
+            출구 배수 (EV/EBITDA)
+        equity_contribution : array_like
+            자본 투자액
+        debt_amount : array_like
+            차입액
+        years : int
+            예측 기간 (년)
+        
+        Returns
+        -------
+        dict
+            거래별 출구 기업가치, 자본 회수액, MOIC, 레버리지 배수 배열
+        """
+        equity = np.asarray(equity_contribution, dtype=np.float64)
+        debt = np.asarray(debt_amount, dtype=np.float64)
+        exit_ev, equity_proceeds, moic = _summarize_deal()(
+            initial_ebitda, wacc, revenue_growth, exit_multiple, equity, debt, years
+        )
+        shape = np.shape(exit_ev)
+        equity = np.broadcast_to(equity, shape)
+        leverage = np.divide(np.broadcast_to(debt, shape), equity,
+                             out=np.zeros(shape), where=equity > 0)[()]
+        
+        return {
+            'exit_enterprise_value': exit_ev,
+            'equity_proceeds': equity_proceeds,
+            'moic': moic,
+            'leverage_multiple': leverage
+        }
 
 
 # 사용 예제
@@ -8,9 +8,92 @@
 - 상관관계 분석
 """
 
+import math
+from statistics import NormalDist
+
 import numpy as np
 from typing import Dict, List, Tuple
 import pandas as pd
+from numba import njit
+
+
+# 연간 거래일 수
+TRADING_DAYS = 252
+SQRT_TRADING_DAYS = math.sqrt(TRADING_DAYS)
+
+
+# 디스크 캐시(cache=True)는 쓰지 않음: 패키지(models.risk-management)로 import해
+# 캐시된 커널은 이 파일을 스크립트로 실행할 때 다시 불러올 수 없음
+@njit(error_model='numpy')
+def _drawdown(prices, out):
+    """최고점 대비 하락률을 한 번의 루프로 out에 기록 (Numba)"""
+    running_max = prices[0]
+    for i in range(prices.size):
+        if prices[i] > running_max:
+            running_max = prices[i]
+        out[i] = abs((prices[i] - running_max) / running_max)
+
+
+@njit(error_model='numpy')
+def _max_drawdown(prices):
+    """중간 배열 없이 최대 드로우다운 계산 (Numba)"""
+    running_max = prices[0]
+    max_dd = 0.0
+    for i in range(prices.size):
+        if prices[i] > running_max:
+            running_max = prices[i]
+        dd = abs((prices[i] - running_max) / running_max)
+        if dd > max_dd:
+            max_dd = dd
+    return max_dd
+
+
+@njit(error_model='numpy')
+def _rolling_corr(x, y, window, out):
+    """
+    윈도우 합을 밀어가며 롤링 상관계수를 out에 기록 (Numba)
+
+    Σx, Σy, Σxy, Σx², Σy²만 유지하므로 임시 배열이 없습니다.
+    누적 오차를 막기 위해 window 스텝마다 합을 다시 계산하고
+    (추가 비용은 스텝당 1회 덧셈 수준), 그 시점의 값을 빼서
+    (상관계수는 불변) 자릿수 손실을 줄입니다. 윈도우가 작으면(8 이하)
+    윈도우 내 분산이 작아 밀어가는 합의 오차가 상대적으로 커지므로
+    매 스텝 다시 계산합니다.
+    """
+    reseed = window if window > 8 else 1
+    sum_x = sum_y = sum_xy = sum_xx = sum_yy = 0.0
+    shift_x = shift_y = 0.0
+
+    for i in range(out.size):
+        if i % reseed == 0:
+            shift_x = x[i]
+            shift_y = y[i]
+            sum_x = sum_y = sum_xy = sum_xx = sum_yy = 0.0
+            for j in range(i, i + window):
+                xj = x[j] - shift_x
+                yj = y[j] - shift_y
+                sum_x += xj
+                sum_y += yj
+                sum_xy += xj * yj
+                sum_xx += xj * xj
+                sum_yy += yj * yj
+        else:
+            # 윈도우에서 빠지는 값 제거, 들어오는 값 추가
+            xo = x[i - 1] - shift_x
+            yo = y[i - 1] - shift_y
+            xn = x[i + window - 1] - shift_x
+            yn = y[i + window - 1] - shift_y
+            sum_x += xn - xo
+            sum_y += yn - yo
+            sum_xy += xn * yn - xo * yo
+            sum_xx += xn * xn - xo * xo
+            sum_yy += yn * yn - yo * yo
+
+        # corr = (nΣxy - ΣxΣy) / sqrt((nΣx² - (Σx)²)(nΣy² - (Σy)²))
+        cov = window * sum_xy - sum_x * sum_y
+        var_x = window * sum_xx - sum_x * sum_x
+        var_y = window * sum_yy - sum_y * sum_y
+        out[i] = cov / np.sqrt(var_x * var_y)
 
 
 class VaRCalculator:
@@ -33,6 +116,31 @@ class VaRCalculator:
         self.returns = returns
         self.confidence_level = confidence_level
         self.alpha = 1 - confidence_level
+        
+        # 수익률 평균/표준편차 (여러 VaR 계산에서 재사용)
+        self.mean_return = np.mean(returns)
+        self.std_return = np.std(returns)
+        self._tail = None
+    
+    def _lower_tail(self) -> Tuple[float, np.ndarray, int]:
+        """
+        (하위 alpha 분위수, 부분 정렬된 수익률, 분위수 아래쪽 인덱스)
+        
+        np.percentile(선형 보간)과 같은 분위수를 전체 정렬 없이
+        np.partition(O(N))으로 계산하고, 결과를 재사용합니다.
+        """
+        if self._tail is None:
+            returns = np.asarray(self.returns, dtype=np.float64)
+            # np.percentile(returns, alpha*100)과 같은 위치·보간식 사용
+            position = (self.alpha * 100 / 100) * (returns.size - 1)
+            lo = int(position)
+            hi = min(lo + 1, returns.size - 1)
+            part = np.partition(returns, [lo, hi])
+            t = position - lo
+            diff = part[hi] - part[lo]
+            var_percentile = part[hi] - diff * (1 - t) if t >= 0.5 else part[lo] + diff * t
+            self._tail = (var_percentile, part, lo)
+        return self._tail
     
     def historical_var(self, portfolio_value: float) -> float:
         """
@@ -40,7 +148,7 @@ class VaRCalculator:
         
         과거 수익률 분포에서 직접 VaR을 계산합니다.
         """
-        var_percentile = np.percentile(self.returns, self.alpha * 100)
+        var_percentile, _, _ = self._lower_tail()
         var = portfolio_value * abs(var_percentile)
         return var
     
@@ -50,14 +158,11 @@ class VaRCalculator:
         
         수익률이 정규분포를 따른다고 가정합니다.
         """
-        mean_return = np.mean(self.returns)
-        std_return = np.std(self.returns)
-        
         # Z-score (표준정규분포에서 신뢰수준에 해당하는 값)
-        z_score = np.abs(np.percentile(np.random.randn(100000), self.alpha * 100))
+        z_score = abs(NormalDist().inv_cdf(self.alpha))
         
         # VaR = 포트폴리오 가치 × (평균 - Z × 표준편차)
-        var = portfolio_value * abs(mean_return - z_score * std_return)
+        var = portfolio_value * abs(self.mean_return - z_score * self.std_return)
         
         return var
     
@@ -67,8 +172,18 @@ class VaRCalculator:
         
         VaR을 초과하는 손실의 평균값
         """
-        var_percentile = np.percentile(self.returns, self.alpha * 100)
-        cvar_return = self.returns[self.returns <= var_percentile].mean()
+        var_percentile, part, lo = self._lower_tail()
+        
+        # part[:lo+1]은 모두 분위수 이하, 그 위쪽은 분위수와 같은 값(동률)만 포함
+        # (part[lo+1]은 위쪽 구간의 최솟값이므로 동률이 없으면 추가 스캔 없음)
+        tail_sum = part[:lo + 1].sum()
+        tail_count = lo + 1
+        if lo + 1 < part.size and part[lo + 1] == var_percentile:
+            ties = np.count_nonzero(part[lo + 1:] == var_percentile)
+            tail_sum += ties * var_percentile
+            tail_count += ties
+        
+        cvar_return = tail_sum / tail_count
         cvar = portfolio_value * abs(cvar_return)
         
         return cvar
@@ -97,6 +212,24 @@ class PortfolioOptimizer:
             self.cov_matrix = returns.cov()
         else:
             self.cov_matrix = cov_matrix
+        
+        # 최적화 반복마다 pandas → NumPy 변환이 일어나지 않도록 배열로 보관
+        self._mu = np.asarray(self.mean_returns, dtype=np.float64)
+        self._cov = np.ascontiguousarray(self.cov_matrix, dtype=np.float64)
+        self._cov_cho = None
+    
+    def _cov_solve(self, b: np.ndarray) -> np.ndarray:
+        """
+        Σx = b 풀이 (촐레스키 분해는 처음 한 번만 계산)
+        
+        공분산 행렬이 양의 정부호가 아니면 np.linalg.LinAlgError,
+        NaN/inf를 포함하면 ValueError 발생
+        """
+        from scipy.linalg import cho_factor, cho_solve
+        
+        if self._cov_cho is None:
+            self._cov_cho = cho_factor(self._cov)
+        return cho_solve(self._cov_cho, b)
     
     def calculate_portfolio_stats(self, weights: np.ndarray) -> Tuple[float, float]:
         """
@@ -107,8 +240,9 @@ class PortfolioOptimizer:
         tuple
             (기대 수익률, 표준편차)
         """
-        portfolio_return = np.sum(self.mean_returns * weights)
-        portfolio_std = np.sqrt(np.dot(weights.T, np.dot(self.cov_matrix, weights)))
+        weights = np.asarray(weights, dtype=np.float64)
+        portfolio_return = self._mu @ weights
+        portfolio_std = np.sqrt(weights @ self._cov @ weights)
         
         return portfolio_return, portfolio_std
     
@@ -127,26 +261,44 @@ class PortfolioOptimizer:
         최소 분산 포트폴리오 찾기
         """
         n_assets = len(self.mean_returns)
+        cov = self._cov
         
-        # 제약 조건: weights 합 = 1, 모두 양수
-        from scipy.optimize import minimize
-        
-        def portfolio_variance(weights):
-            return np.dot(weights.T, np.dot(self.cov_matrix, weights))
+        # 합 = 1 제약만 있을 때의 해석해 w = Σ⁻¹1 / (1ᵀΣ⁻¹1)
+        # 모든 비중이 0 이상이면 양수 제약이 걸리지 않으므로 그대로 최적해
+        try:
+            inv_ones = self._cov_solve(np.ones(n_assets))
+            weights = inv_ones / inv_ones.sum()
+        except (np.linalg.LinAlgError, ValueError):
+            weights = None
         
-        constraints = {'type': 'eq', 'fun': lambda x: np.sum(x) - 1}
-        bounds = tuple((0, 1) for _ in range(n_assets))
-        initial_weights = np.array([1/n_assets] * n_assets)
-        
-        result = minimize(
-            portfolio_variance,
-            initial_weights,
-            method='SLSQP',
-            bounds=bounds,
-            constraints=constraints
-        )
+        if weights is not None and np.all(np.isfinite(weights)) and np.all(weights >= -1e-12):
+            weights = np.clip(weights, 0.0, None)
+        else:
+            # 제약 조건: weights 합 = 1, 모두 양수
+            from scipy.optimize import minimize
+            
+            def portfolio_variance(weights):
+                # (분산, 기울기 2Σw)
+                cov_w = cov @ weights
+                return weights @ cov_w, 2.0 * cov_w
+            
+            constraints = {'type': 'eq', 'fun': lambda x: np.sum(x) - 1,
+                           'jac': lambda x: np.ones_like(x)}
+            bounds = tuple((0, 1) for _ in range(n_assets))
+            initial_weights = np.array([1/n_assets] * n_assets)
+            
+            result = minimize(
+                portfolio_variance,
+                initial_weights,
+                method='SLSQP',
+                jac=True,
+                bounds=bounds,
+                constraints=constraints,
+                options={'ftol': 1e-9}
+            )
+            
+            weights = result.x
         
-        weights = result.x
         p_return, p_std = self.calculate_portfolio_stats(weights)
         
         return {
@@ -161,25 +313,50 @@ class PortfolioOptimizer:
         샤프 비율 최대화 포트폴리오
         """
         n_assets = len(self.mean_returns)
+        mu, cov = self._mu, self._cov
         
-        from scipy.optimize import minimize
+        # 합 = 1 제약만 있을 때의 접점 포트폴리오 w ∝ Σ⁻¹(μ - rf)
+        # 모든 비중이 0 이상이면 양수 제약이 걸리지 않으므로 그대로 최적해
+        try:
+            z = self._cov_solve(mu - risk_free_rate)
+            z_sum = z.sum()
+            weights = z / z_sum if z_sum > 0 else None
+        except (np.linalg.LinAlgError, ValueError):
+            weights = None
         
-        def neg_sharpe(weights):
-            return -self.calculate_sharpe_ratio(weights, risk_free_rate)
-        
-        constraints = {'type': 'eq', 'fun': lambda x: np.sum(x) - 1}
-        bounds = tuple((0, 1) for _ in range(n_assets))
-        initial_weights = np.array([1/n_assets] * n_assets)
-        
-        result = minimize(
-            neg_sharpe,
-            initial_weights,
-            method='SLSQP',
-            bounds=bounds,
-            constraints=constraints
-        )
+        if weights is not None and np.all(np.isfinite(weights)) and np.all(weights >= -1e-12):
+            weights = np.clip(weights, 0.0, None)
+        else:
+            from scipy.optimize import minimize
+            
+            def neg_sharpe(weights):
+                # (-샤프 비율, 기울기)
+                # ∂S/∂w = μ/σ - (μ·w - rf) Σw / σ³
+                cov_w = cov @ weights
+                p_std = np.sqrt(weights @ cov_w)
+                if p_std <= 0:
+                    return 0.0, np.zeros_like(weights)
+                excess = mu @ weights - risk_free_rate
+                grad = mu / p_std - excess * cov_w / p_std**3
+                return -excess / p_std, -grad
+            
+            constraints = {'type': 'eq', 'fun': lambda x: np.sum(x) - 1,
+                           'jac': lambda x: np.ones_like(x)}
+            bounds = tuple((0, 1) for _ in range(n_assets))
+            initial_weights = np.array([1/n_assets] * n_assets)
+            
+            result = minimize(
+                neg_sharpe,
+                initial_weights,
+                method='SLSQP',
+                jac=True,
+                bounds=bounds,
+                constraints=constraints,
+                options={'ftol': 1e-9}
+            )
+            
+            weights = result.x
         
-        weights = result.x
         p_return, p_std = self.calculate_portfolio_stats(weights)
         
         return {
@@ -215,12 +392,20 @@ class CorrelationAnalysis:
         np.ndarray
             시간에 따른 상관관계
         """
-        correlations = []
-        for i in range(len(series1) - window):
-            corr = np.corrcoef(series1[i:i+window], series2[i:i+window])[0, 1]
-            correlations.append(corr)
+        x = np.asarray(series1, dtype=np.float64)
+        y = np.asarray(series2, dtype=np.float64)
+        if x.shape != y.shape:
+            raise ValueError(f"두 시계열의 길이({len(x)}, {len(y)})가 다릅니다.")
+        if window < 1:
+            raise ValueError("윈도우는 1 이상이어야 합니다.")
+        n_windows = len(x) - window
+        if n_windows <= 0:
+            return np.array([])
+        
+        correlations = np.empty(n_windows)
+        _rolling_corr(x, y, window, correlations)
         
-        return np.array(correlations)
+        return correlations
     
     @staticmethod
     def correlation_matrix(returns: pd.DataFrame) -> pd.DataFrame:
@@ -239,7 +424,7 @@ class CorrelationAnalysis:
         (가중평균 개별 변동성) / (포트폴리오 변동성)
         높을수록 다각화가 잘됨
         """
-        weighted_vol = np.sum(weights * individual_vols)
+        weighted_vol = float(np.dot(weights, individual_vols))
         return weighted_vol / portfolio_vol if portfolio_vol > 0 else 0
 
 
@@ -253,16 +438,21 @@ class RiskMetrics:
         """
         드로우다운 계산 (최고점에서 현재까지 하락률)
         """
-        running_max = np.maximum.accumulate(prices)
-        drawdown = (prices - running_max) / running_max
-        return np.abs(drawdown)
+        prices = np.asarray(prices, dtype=np.float64)
+        drawdown = np.empty_like(prices)
+        if prices.size:
+            _drawdown(prices, drawdown)
+        return drawdown
     
     @staticmethod
     def max_drawdown(prices: np.ndarray) -> float:
         """
         최대 드로우다운
         """
-        return np.max(RiskMetrics.drawdown(prices))
+        prices = np.asarray(prices, dtype=np.float64)
+        if prices.size == 0:
+            raise ValueError("가격 데이터가 비어 있습니다.")
+        return _max_drawdown(prices)
     
     @staticmethod
     def sortino_ratio(returns: np.ndarray, target_return: float = 0.0,
@@ -284,7 +474,7 @@ class RiskMetrics:
         """
         칼마 비율 = 연간 수익률 / 최대 드로우다운
         """
-        annual_return = np.mean(returns) * 252
+        annual_return = np.mean(returns) * TRADING_DAYS
         max_dd = RiskMetrics.max_drawdown(prices)
         
         return annual_return / max_dd if max_dd > 0 else 0
@@ -297,8 +487,8 @@ if __name__ == "__main__":
     print("="*70)
     
     # 샘플 데이터 생성
-    np.random.seed(42)
-    returns = np.random.randn(252) * 0.02 + 0.0005
+    rng = np.random.default_rng(42)
+    returns = rng.standard_normal(TRADING_DAYS) * 0.02 + 0.0005
     prices = 100 * (1 + returns).cumprod()
     portfolio_value = 1000000
     
@@ -322,7 +512,7 @@ if __name__ == "__main__":
     print(f"최대 드로우다운: {max_dd*100:.2f}%")
     
     # 샤프 비율
-    sharpe = (np.mean(returns)*252 - 0.02) / (np.std(returns)*np.sqrt(252))
+    sharpe = (np.mean(returns)*TRADING_DAYS - 0.02) / (np.std(returns)*SQRT_TRADING_DAYS)
     print(f"샤프 비율: {sharpe:.2f}")
     
     # 칼마 비율
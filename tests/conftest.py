@@ -0,0 +1,17 @@
+"""
+테스트 공통 도우미
+"""
+
+import importlib.util
+import os
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def load_model(name):
+    """하이픈이 들어간 모델 파일(models/<name>.py)을 경로로 직접 로드"""
+    path = os.path.join(ROOT, 'models', f'{name}.py')
+    spec = importlib.util.spec_from_file_location(name.replace('-', '_'), path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
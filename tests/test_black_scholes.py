@@ -8,7 +8,11 @@ import sys
 import os
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from models.black_scholes import BlackScholesModel, calculate_implied_volatility
+from models.black_scholes import (
+    BlackScholesModel,
+    calculate_implied_volatility,
+    calculate_implied_volatility_vec,
+)
 
 
 class TestBlackScholesModel:
@@ -23,6 +27,13 @@ class TestBlackScholesModel:
         assert bs.r == 0.05
         assert bs.sigma == 0.2
 
+    def test_inputs_read_only(self):
+        """입력값은 읽기 전용 (캐시된 공통 항과 어긋나지 않도록)"""
+        bs = BlackScholesModel(S=100, K=100, T=1, r=0.05, sigma=0.2)
+        for name in ('S', 'K', 'T', 'r', 'sigma'):
+            with pytest.raises(AttributeError):
+                setattr(bs, name, 1.0)
+
     def test_invalid_parameters(self):
         """잘못된 파라미터 테스트"""
         with pytest.raises(ValueError):
@@ -37,6 +48,15 @@ class TestBlackScholesModel:
         with pytest.raises(ValueError):
             BlackScholesModel(S=100, K=100, T=1, r=0.05, sigma=-0.2)
 
+    def test_from_trusted(self):
+        """검증 생략 생성 테스트"""
+        bs = BlackScholesModel(S=100, K=105, T=0.5, r=0.05, sigma=0.2)
+        trusted = BlackScholesModel.from_trusted(S=100, K=105, T=0.5, r=0.05, sigma=0.2)
+
+        assert trusted.call_price() == bs.call_price()
+        assert trusted.put_price() == bs.put_price()
+        assert trusted.get_all_greeks('put') == bs.get_all_greeks('put')
+
     def test_call_price(self):
         """콜 옵션 가격 테스트"""
         bs = BlackScholesModel(S=100, K=100, T=1, r=0.05, sigma=0.2)
@@ -70,6 +90,24 @@ class TestBlackScholesModel:
 
         assert abs(lhs - rhs) < 0.01
 
+    def test_price_both(self):
+        """콜/풋 동시 계산 테스트"""
+        bs = BlackScholesModel(S=95, K=100, T=0.5, r=0.05, sigma=0.3)
+        call_price, put_price = bs.price_both()
+
+        assert abs(call_price - bs.call_price()) < 1e-10
+        assert abs(put_price - bs.put_price()) < 1e-10
+
+    def test_native_float_results(self):
+        """NumPy 스칼라 입력에도 Python float을 반환하는지 테스트"""
+        bs = BlackScholesModel(np.float64(100), np.float64(105), np.float64(0.5),
+                               np.float64(0.05), np.float64(0.2))
+
+        assert type(bs.call_price()) is float
+        assert type(bs.put_price()) is float
+        assert type(bs.intrinsic_value('put')) is float
+        assert all(type(value) is float for value in bs.get_all_greeks('call'))
+
     def test_greeks_range(self):
         """Greeks 범위 테스트"""
         bs = BlackScholesModel(S=100, K=100, T=1, r=0.05, sigma=0.2)
@@ -113,6 +151,74 @@ class TestBlackScholesModel:
         assert call_time_value > 0
         assert put_time_value > 0
 
+    def test_greeks_grid(self):
+        """격자 Greeks 계산이 스칼라 계산과 일치하는지 테스트"""
+        S_range = np.linspace(80, 120, 5)
+        sigma_range = np.linspace(0.1, 0.4, 4)
+        K, T, r = 100, 30/365, 0.05
+
+        for option_type in ['call', 'put']:
+            greeks = {
+                name: BlackScholesModel.greeks_grid(
+                    S_range[None, :], K, T, r, sigma_range[:, None], name, option_type
+                )
+                for name in ['delta', 'gamma', 'theta', 'theta_daily', 'vega', 'rho']
+            }
+
+            for i, sigma in enumerate(sigma_range):
+                for j, S in enumerate(S_range):
+                    expected = BlackScholesModel(S, K, T, r, sigma).get_all_greeks(option_type)
+                    for name, grid in greeks.items():
+                        assert grid.shape == (len(sigma_range), len(S_range))
+                        assert abs(grid[i, j] - getattr(expected, name)) < 1e-10
+
+        with pytest.raises(ValueError):
+            BlackScholesModel.greeks_grid(100, 100, 1, 0.05, 0.2, 'speed')
+
+    def test_price_greeks_batch(self):
+        """배치 커널 결과가 스칼라 계산과 일치하는지 테스트"""
+        S = np.array([90.0, 100.0, 110.0, 100.0])
+        K, T, r = 100.0, 0.5, 0.05
+        sigma = np.array([0.15, 0.2, 0.25, 0.3])
+        option_types = np.array(['call', 'put', 'call', 'put'])
+
+        price, delta, gamma, vega, theta, rho = BlackScholesModel.price_greeks_batch(
+            S, K, T, r, sigma, option_types
+        )
+
+        for i in range(len(S)):
+            bs = BlackScholesModel(S[i], K, T, r, sigma[i])
+            option_type = option_types[i]
+            greeks = bs.get_all_greeks(option_type)
+            expected_price = bs.call_price() if option_type == 'call' else bs.put_price()
+
+            assert abs(price[i] - expected_price) < 1e-8
+            assert abs(delta[i] - greeks.delta) < 1e-8
+            assert abs(gamma[i] - greeks.gamma) < 1e-8
+            assert abs(vega[i] - greeks.vega) < 1e-8
+            assert abs(theta[i] - greeks.theta) < 1e-8
+            assert abs(rho[i] - greeks.rho) < 1e-8
+
+    def test_deep_otm_put_precision(self):
+        """깊은 외가격 풋도 N(-d)로 계산해 상대 오차가 작음"""
+        from scipy.stats import norm
+
+        S, K, T, r, sigma = 100.0, 70.0, 0.25, 0.05, 0.1
+        bs = BlackScholesModel(S, K, T, r, sigma)
+        strike_pv = K * np.exp(-r * T)
+        nd1_neg, nd2_neg = norm.cdf(-bs.d1()), norm.cdf(-bs.d2())
+        expected_price = strike_pv * nd2_neg - S * nd1_neg
+        expected_rho = -T * strike_pv * nd2_neg / 100
+
+        assert bs.put_price() == pytest.approx(expected_price, rel=1e-9)
+        assert bs.put_rho() == pytest.approx(expected_rho, rel=1e-9)
+        assert bs.get_all_greeks('put').rho == pytest.approx(expected_rho, rel=1e-9)
+        assert bs.get_all_greeks('put').theta == pytest.approx(bs.put_theta(), rel=1e-12)
+
+        price, *_, rho = BlackScholesModel.price_greeks_batch(S, K, T, r, sigma, 'put')
+        assert price == pytest.approx(expected_price, rel=1e-9)
+        assert rho == pytest.approx(expected_rho, rel=1e-9)
+
 
 class TestImpliedVolatility:
     """내재 변동성 계산 테스트"""
@@ -133,6 +239,29 @@ class TestImpliedVolatility:
         # 원래 변동성과 비슷해야 함
         assert abs(sigma_implied - sigma_true) < 0.01
 
+    def test_implied_volatility_vec(self):
+        """벡터화된 내재 변동성 계산 테스트"""
+        S, T, r = 100, 0.5, 0.05
+        K = np.array([80, 90, 100, 110, 120])
+        sigma_true = np.array([0.35, 0.28, 0.25, 0.22, 0.30])
+        option_types = np.array(['call', 'put', 'call', 'put', 'call'])
+
+        market_prices = np.array([
+            BlackScholesModel(S, k, T, r, s).call_price() if o == 'call'
+            else BlackScholesModel(S, k, T, r, s).put_price()
+            for k, s, o in zip(K, sigma_true, option_types)
+        ])
+
+        sigma_implied = calculate_implied_volatility_vec(
+            market_prices, S, K, T, r, option_types
+        )
+
+        assert sigma_implied.shape == K.shape
+        assert np.all(np.abs(sigma_implied - sigma_true) < 0.01)
+
+        for price, k, o, sigma in zip(market_prices, K, option_types, sigma_implied):
+            assert abs(calculate_implied_volatility(price, S, k, T, r, o) - sigma) < 1e-8
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,40 @@
+"""
+금융 계산 유틸리티 테스트
+"""
+
+import pytest
+import numpy as np
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.calculations import calculate_historical_volatility, calculate_sharpe_ratio
+
+
+class TestMeanStd:
+    """단일 패스 평균/표준편차를 쓰는 함수 테스트"""
+
+    @pytest.mark.parametrize('seed', range(5))
+    @pytest.mark.parametrize('n', [2, 30, 1000])
+    def test_sharpe_ratio_matches_np_std(self, seed, n):
+        """샤프 비율이 np.mean/np.std 기반 계산과 일치"""
+        returns = np.random.default_rng(seed).normal(0.0005, 0.02, n)
+        expected = (np.mean(returns) * 252 - 0.02) / (np.std(returns) * np.sqrt(252))
+        assert calculate_sharpe_ratio(returns) == pytest.approx(expected, rel=1e-9)
+
+    @pytest.mark.parametrize('seed', range(5))
+    @pytest.mark.parametrize('window', [5, 30, 500])
+    def test_historical_volatility_matches_np_std(self, seed, window):
+        """역사적 변동성이 최근 window개 로그 수익률의 np.std와 일치"""
+        rng = np.random.default_rng(seed)
+        prices = 100 * np.exp(np.cumsum(rng.normal(0.0005, 0.02, 300)))
+        returns = np.log(prices[1:] / prices[:-1])[-window:]
+        expected = np.std(returns) * np.sqrt(252)
+        assert calculate_historical_volatility(prices, window) == pytest.approx(expected, rel=1e-9)
+
+    def test_constant_series(self):
+        """상수 수익률(반올림 오차만 있는 경우 포함)은 변동성 0"""
+        assert calculate_historical_volatility(np.full(50, 100.0)) == 0.0
+        assert calculate_historical_volatility(100 * 1.01 ** np.arange(50)) == 0.0
+        assert calculate_sharpe_ratio(np.full(100, 0.001)) == 0.0
+        assert calculate_sharpe_ratio(np.zeros(10)) == 0.0
@@ -0,0 +1,44 @@
+"""
+선물 모델 테스트
+"""
+
+import pytest
+import numpy as np
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from models.futures import FuturesModel
+
+
+class TestFuturesModel:
+    """선물 모델 테스트"""
+
+    def test_inputs_read_only(self):
+        """입력값은 읽기 전용 (캐시된 이론가격과 어긋나지 않도록)"""
+        model = FuturesModel(S=100, r=0.05, q=0.01, T=0.5)
+        for name in ('S', 'r', 'q', 'T'):
+            with pytest.raises(AttributeError):
+                setattr(model, name, 1.0)
+        assert (model.S, model.r, model.q, model.T) == (100, 0.05, 0.01, 0.5)
+
+    @pytest.mark.parametrize('transaction_cost', [0.0, 0.002])
+    def test_arbitrage_profit_vec(self, transaction_cost):
+        """벡터화 결과가 가격별 arbitrage_profit과 일치"""
+        model = FuturesModel(S=100, r=0.05, q=0.01, T=0.5)
+        theo = model.theoretical_price()
+        prices = theo + np.array([-3.0, -0.1, 0.0, 0.15, 2.5])
+
+        result = model.arbitrage_profit_vec(prices, transaction_cost)
+
+        assert result['theoretical_price'] == theo
+        for i, price in enumerate(prices.tolist()):
+            expected = model.arbitrage_profit(price, transaction_cost)
+            for key in ('market_price', 'price_difference',
+                        'buy_spot_sell_futures_profit', 'sell_spot_buy_futures_profit'):
+                assert result[key][i] == expected[key]
+            assert result['arbitrage_opportunity'][i] == expected['arbitrage_opportunity']
+
+        if transaction_cost > 0:
+            np.testing.assert_array_equal(result['arbitrage_opportunity'],
+                                          [True, False, False, False, True])
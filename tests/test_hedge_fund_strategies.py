@@ -0,0 +1,264 @@
+"""
+헤지펀드 전략 모델 테스트
+"""
+
+import numpy as np
+import pytest
+
+from conftest import load_model
+
+
+hf = load_model('hedge-fund-strategies')
+
+
+class TestPairsTrading:
+    """페어 트레이딩 스프레드 테스트"""
+
+    def test_calculate_spread_scalar(self):
+        """스칼라 입력은 Python 스칼라로 반환"""
+        pairs = hf.PairsTrading(initial_capital=100_000)
+        result = pairs.calculate_spread(105.0, 100.0, 2.0, 1.2)
+
+        assert type(result['current_spread']) is float
+        assert type(result['z_score']) is float
+        assert type(result['is_overvalued']) is bool
+        assert type(result['mean_reversion_opportunity']) is bool
+        assert result['z_score'] == pytest.approx(2.5)
+        assert result['is_overvalued'] and not result['is_undervalued']
+
+    @pytest.mark.parametrize('std', [0.0, -1.0])
+    def test_calculate_spread_scalar_nonpositive_std(self, std):
+        """표준편차가 0 이하이면 Z-Score는 0"""
+        pairs = hf.PairsTrading(initial_capital=100_000)
+        result = pairs.calculate_spread(105.0, 100.0, 2.0, std)
+
+        assert result['z_score'] == 0.0
+        assert type(result['z_score']) is float
+        assert not result['mean_reversion_opportunity']
+
+    def test_calculate_spread_array(self):
+        """시계열 입력은 시점별 배열, 표준편차 0인 시점은 Z-Score 0"""
+        pairs = hf.PairsTrading(initial_capital=100_000)
+        long_price = np.array([105.0, 98.0, 101.0, 110.0])
+        short_price = np.array([100.0, 100.0, 100.0, 100.0])
+        std = np.array([1.0, 0.5, 0.0, 4.0])
+        result = pairs.calculate_spread(long_price, short_price, 1.0, std)
+
+        np.testing.assert_array_equal(result['current_spread'], [5.0, -2.0, 1.0, 10.0])
+        np.testing.assert_allclose(result['z_score'], [4.0, -6.0, 0.0, 2.25])
+        np.testing.assert_array_equal(result['is_overvalued'], [True, False, False, True])
+        np.testing.assert_array_equal(result['is_undervalued'], [False, True, False, False])
+        np.testing.assert_array_equal(result['mean_reversion_opportunity'],
+                                      [True, True, False, True])
+
+
+class TestLeverage:
+    """레버리지 계산 테스트"""
+
+    def test_leveraged_return_scalar(self):
+        """스칼라 입력은 캐시된 함수와 같은 결과"""
+        direct = hf.Leverage.calculate_leveraged_return(0.1, 2.0, 0.05, 30)
+        cached = hf.Leverage.leveraged_return_function(0.05, 30)(0.1, 2.0)
+        assert direct == cached
+        assert direct == pytest.approx(0.1 * 2.0 - 1.0 * 0.05 / 365 * 30)
+
+    def test_leveraged_return_array_borrowing_terms(self):
+        """차입 조건 배열도 브로드캐스팅"""
+        result = hf.Leverage.calculate_leveraged_return(
+            0.1, 2.0, np.array([0.03, 0.05]), np.array([30, 60])
+        )
+        expected = 0.2 - np.array([0.03, 0.05]) / 365 * np.array([30, 60])
+        np.testing.assert_allclose(result, expected)
+
+        result = hf.Leverage.calculate_leveraged_return(0.1, 2.0, np.array([0.03, 0.05]), 30)
+        np.testing.assert_allclose(result, [0.1975342465753, 0.1958904109589])
+
+
+    def test_margin_call_price_scalar(self):
+        """스칼라 입력은 Python float"""
+        price = hf.Leverage.margin_call_price(100.0, 2.0)
+        assert type(price) is float
+        assert price == pytest.approx(100.0 * (1 - 0.7 / 2.0))
+
+    def test_margin_call_price_grid_and_out(self):
+        """np.ix_ 격자와 out 배열 기록"""
+        prices = np.array([50.0, 100.0, 200.0])
+        leverages = np.array([1.0, 2.0, 4.0, 5.0])
+        expected = np.array([[p * (1 - 0.7 / lev) for lev in leverages] for p in prices])
+
+        grid = hf.Leverage.margin_call_price(*np.ix_(prices, leverages))
+        np.testing.assert_allclose(grid, expected)
+
+        out = np.empty((3, 4))
+        result = hf.Leverage.margin_call_price(*np.ix_(prices, leverages), out=out)
+        assert result is out
+        np.testing.assert_allclose(out, expected)
+
+
+def _baseline_positions_value(long_holdings, short_holdings, long_prices, short_prices,
+                              initial_capital):
+    """배열 보관소 도입 전 구현 (딕셔너리 순회)"""
+    long_value = long_pnl = 0.0
+    for symbol, holding in long_holdings.items():
+        if symbol in long_prices:
+            current_value = long_prices[symbol] * holding['quantity']
+            long_value += current_value
+            long_pnl += current_value - holding['entry_value']
+
+    short_value = short_pnl = 0.0
+    for symbol, holding in short_holdings.items():
+        if symbol in short_prices:
+            current_price = short_prices[symbol]
+            short_pnl += (holding['entry_price'] - current_price) * holding['quantity']
+            short_value -= current_price * holding['quantity']
+
+    total_pnl = long_pnl + short_pnl
+    return hf.PositionsValue(long_value, short_value, long_value + short_value,
+                             long_pnl, short_pnl, total_pnl, total_pnl / initial_capital)
+
+
+def _strategy(n_long, n_short, seed=0):
+    rng = np.random.default_rng(seed)
+    strategy = hf.LongShortStrategy(initial_capital=1_000_000)
+    for i in range(n_long):
+        strategy.add_long_position(f'L{i}', float(rng.uniform(10, 200)), int(rng.integers(1, 500)))
+    for i in range(n_short):
+        strategy.add_short_position(f'S{i}', float(rng.uniform(10, 200)), int(rng.integers(1, 500)))
+    return strategy, rng
+
+
+def _approx(result, expected):
+    return tuple(result) == pytest.approx(tuple(expected), rel=1e-12, abs=1e-9)
+
+
+class TestLongShortStrategy:
+    """롱/숏 전략 포지션 보관소 테스트"""
+
+    def test_unpriced_symbols_excluded(self):
+        """현재가격이 없는 종목은 가치와 손익에서 제외"""
+        strategy, rng = _strategy(6, 4)
+        long_prices = {f'L{i}': float(rng.uniform(10, 200)) for i in (0, 2, 5)}
+        short_prices = {'S1': 50.0, 'UNKNOWN': 10.0}
+
+        result = strategy.calculate_positions_value(long_prices, short_prices)
+        expected = _baseline_positions_value(strategy.long_holdings, strategy.short_holdings,
+                                             long_prices, short_prices, 1_000_000)
+        assert _approx(result, expected)
+
+        # 가격 벡터에서 priced=False인 종목도 제외
+        long_vector = np.array([long_prices.get(s, 999.0) for s in strategy.long_symbols])
+        long_priced = np.array([s in long_prices for s in strategy.long_symbols])
+        short_vector = np.array([short_prices.get(s, 999.0) for s in strategy.short_symbols])
+        short_priced = np.array([s in short_prices for s in strategy.short_symbols])
+        strategy.update_prices(long_vector, short_vector, long_priced, short_priced)
+        assert strategy.calculate_positions_value() == result
+
+    def test_unpriced_nan_slot_excluded(self):
+        """가격이 없는 자리의 NaN은 결과에 섞이지 않음"""
+        strategy = hf.LongShortStrategy(initial_capital=100_000)
+        strategy.add_long_position('AAPL', 150.0, 100)
+        strategy.add_long_position('MSFT', 20.0, 50)
+        strategy.add_short_position('TSLA', 200.0, 40)
+
+        strategy.update_prices(np.array([np.nan, 25.0]), np.array([np.nan]),
+                               long_priced=np.array([False, True]),
+                               short_priced=np.array([False]))
+        result = strategy.calculate_positions_value()
+
+        assert result == strategy.calculate_positions_value({'MSFT': 25.0}, {})
+        assert result.long_value == 25.0 * 50
+        assert result.total_pnl == 5.0 * 50
+        assert result.short_value == 0.0
+
+    def test_classify_exposure(self):
+        """여러 전략의 시장 중립도가 calculate_market_exposure와 일치"""
+        strategies = []
+        for long_qty, short_qty in [(100, 100), (100, 50), (100, 95), (0, 0)]:
+            strategy = hf.LongShortStrategy(initial_capital=100_000)
+            if long_qty:
+                strategy.add_long_position('A', 10.0, long_qty)
+            if short_qty:
+                strategy.add_short_position('B', 10.0, short_qty)
+            strategies.append(strategy.calculate_market_exposure())
+
+        ratio, neutral = hf.LongShortStrategy.classify_exposure(
+            [e['net_exposure'] for e in strategies],
+            [e['gross_exposure'] for e in strategies],
+        )
+
+        np.testing.assert_allclose(ratio, [e['market_neutral_ratio'] for e in strategies])
+        np.testing.assert_array_equal(neutral, [e['is_market_neutral'] for e in strategies])
+        # 총 노출도 0이면 중립도 0
+        assert ratio[-1] == 0.0 and neutral[-1]
+
+    def test_overwrite_existing_symbol(self):
+        """같은 종목을 다시 추가하면 덮어쓰고 진입 금액 합계도 갱신"""
+        strategy = hf.LongShortStrategy(initial_capital=100_000)
+        strategy.add_long_position('AAPL', 150.0, 100)
+        strategy.add_long_position('MSFT', 300.0, 50)
+        strategy.add_long_position('AAPL', 160.0, 30)
+        strategy.add_short_position('TSLA', 200.0, 40)
+        strategy.add_short_position('TSLA', 210.0, 10)
+
+        assert strategy.long_symbols == ['AAPL', 'MSFT']
+        assert strategy.long_holdings['AAPL'] == {
+            'entry_price': 160.0, 'quantity': 30, 'entry_value': 4800.0
+        }
+        assert strategy.short_holdings == {
+            'TSLA': {'entry_price': 210.0, 'quantity': 10, 'entry_value': 2100.0}
+        }
+
+        exposure = strategy.calculate_market_exposure()
+        assert exposure['long_exposure'] == 160.0 * 30 + 300.0 * 50
+        assert exposure['short_exposure'] == 210.0 * 10
+
+        result = strategy.calculate_positions_value({'AAPL': 170.0, 'MSFT': 310.0},
+                                                    {'TSLA': 205.0})
+        assert result.long_pnl == pytest.approx(10.0 * 30 + 10.0 * 50)
+        assert result.short_pnl == pytest.approx(5.0 * 10)
+
+    def test_growth_past_initial_capacity(self):
+        """초기 용량(16)을 넘겨도 기존 포지션과 가격이 유지"""
+        strategy, rng = _strategy(10, 3, seed=1)
+        strategy.update_prices(np.full(10, 100.0), np.full(3, 100.0))
+        priced = strategy.calculate_positions_value()
+
+        for i in range(10, 40):
+            strategy.add_long_position(f'L{i}', float(rng.uniform(10, 200)), int(rng.integers(1, 500)))
+        assert len(strategy.long_symbols) == 40
+        assert list(strategy.long_holdings) == [f'L{i}' for i in range(40)]
+
+        # 새로 추가된 종목은 가격이 없으므로 결과가 변하지 않음
+        assert _approx(strategy.calculate_positions_value(), priced)
+
+        entry_total = sum(h['entry_value'] for h in strategy.long_holdings.values())
+        assert strategy.calculate_market_exposure()['long_exposure'] == pytest.approx(entry_total)
+
+        long_prices = {s: float(rng.uniform(10, 200)) for s in strategy.long_symbols}
+        short_prices = {s: 100.0 for s in strategy.short_symbols}
+        result = strategy.calculate_positions_value(long_prices, short_prices)
+        expected = _baseline_positions_value(strategy.long_holdings, strategy.short_holdings,
+                                             long_prices, short_prices, 1_000_000)
+        assert _approx(result, expected)
+
+    def test_dict_and_vector_prices_identical(self):
+        """딕셔너리 가격과 가격 벡터는 같은 PositionsValue"""
+        strategy, rng = _strategy(25, 18, seed=2)
+        long_vector = rng.uniform(10, 200, 25)
+        short_vector = rng.uniform(10, 200, 18)
+
+        from_dict = strategy.calculate_positions_value(
+            dict(zip(strategy.long_symbols, long_vector.tolist())),
+            dict(zip(strategy.short_symbols, short_vector.tolist())),
+        )
+        strategy.update_prices(long_vector, short_vector)
+        from_vector = strategy.calculate_positions_value()
+
+        assert isinstance(from_vector, hf.PositionsValue)
+        assert from_vector == from_dict
+
+    def test_price_vector_length_mismatch(self):
+        """포지션 수와 다른 길이의 가격 벡터는 거부"""
+        strategy, _ = _strategy(3, 2)
+        with pytest.raises(ValueError):
+            strategy.update_prices(np.ones(2), np.ones(2))
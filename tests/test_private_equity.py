@@ -0,0 +1,156 @@
+"""
+사모펀드 모델 테스트
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from conftest import load_model
+
+
+pe = load_model('private-equity')
+
+
+def _baseline_debt_schedule(debt_amount, interest_rate, loan_term, annual_repayment):
+    """Numba 커널 도입 전 구현 (경고 출력 제외)"""
+    schedule = []
+    remaining_debt = debt_amount
+    for year in range(loan_term):
+        interest_expense = remaining_debt * interest_rate
+        principal_repayment = min(annual_repayment - interest_expense, remaining_debt)
+        if principal_repayment < 0:
+            principal_repayment = 0
+        remaining_debt -= principal_repayment
+        schedule.append({
+            'year': year + 1,
+            'beginning_debt': remaining_debt + principal_repayment,
+            'interest_expense': interest_expense,
+            'principal_repayment': principal_repayment,
+            'ending_debt': remaining_debt
+        })
+    return pd.DataFrame(schedule)
+
+
+class TestLBOModel:
+    """LBO 모델 테스트"""
+
+    @pytest.mark.parametrize('annual_repayment, warns', [
+        (150.0, False),   # 일반 상환
+        (40.0, True),     # 상환액 < 이자 (상환 부족 경고)
+        (400.0, False),   # 중도 완납
+    ])
+    def test_debt_schedule_matches_baseline(self, capsys, annual_repayment, warns):
+        """Numba 상환 일정이 이전 DataFrame 구현과 일치"""
+        lbo = pe.LBOModel(1000.0, 300.0, 700.0, interest_rate=0.08, loan_term=6)
+        expected = _baseline_debt_schedule(700.0, 0.08, 6, annual_repayment)
+
+        arrays = lbo.calculate_debt_schedule_arrays(annual_repayment)
+        assert ('경고' in capsys.readouterr().out) == warns
+        schedule = lbo.calculate_debt_schedule(annual_repayment)
+
+        pd.testing.assert_frame_equal(schedule, expected, check_dtype=False, rtol=1e-12)
+        assert list(arrays) == list(expected.columns)
+        for column, values in arrays.items():
+            np.testing.assert_allclose(values, expected[column], rtol=1e-12)
+
+    def test_debt_schedule_full_payoff(self):
+        """완납 이후에는 원금 상환과 잔액이 0"""
+        lbo = pe.LBOModel(1000.0, 300.0, 700.0, interest_rate=0.08, loan_term=6)
+        arrays = lbo.calculate_debt_schedule_arrays(400.0)
+
+        assert arrays['ending_debt'][-1] == 0.0
+        # 2년 차에 완납 (잔액보다 큰 원금 상환액은 잔액으로 제한)
+        assert arrays['ending_debt'][1] == 0.0
+        assert np.all(arrays['principal_repayment'][2:] == 0.0)
+        assert arrays['principal_repayment'].sum() == pytest.approx(700.0)
+
+
+class TestIRR:
+    """IRR 계산 테스트"""
+
+    @pytest.mark.parametrize('ratio', [0.001, 0.05, 0.5, 1.0, 1.5, 3.0, 10.0])
+    @pytest.mark.parametrize('n', [1, 3, 5, 10])
+    def test_single_sign_change(self, ratio, n):
+        """투자 1회, 회수 1회는 닫힌 해 (P/I)^(1/n) - 1과 일치"""
+        irr = pe.PrivateEquityMetrics.calculate_irr({0: -100.0, n: 100.0 * ratio})
+        assert irr == pytest.approx(ratio ** (1 / n) - 1, abs=1e-6)
+
+    def test_very_negative_irr(self):
+        """-99%에 가까운 IRR도 -100% 경계를 넘지 않고 수렴"""
+        irr = pe.PrivateEquityMetrics.calculate_irr({0: -100.0, 1: 0.1})
+        assert irr == pytest.approx(-0.999, abs=1e-6)
+        assert irr > -1.0
+
+    @pytest.mark.parametrize('cash_flows', [
+        {0: 100.0, 1: 100.0},
+        {0: -100.0, 1: -50.0},
+        {0: -100.0, 3: 0.0},
+    ])
+    def test_no_solution(self, cash_flows):
+        """NPV = 0의 해가 없으면 NaN"""
+        assert np.isnan(pe.PrivateEquityMetrics.calculate_irr(cash_flows))
+
+    def test_npv_zero_at_irr(self):
+        """여러 기간 현금흐름에서 IRR로 할인한 NPV는 0"""
+        cash_flows = {0: -100.0, 1: 30.0, 2: 30.0, 4: 30.0, 5: 40.0}
+        irr = pe.PrivateEquityMetrics.calculate_irr(cash_flows)
+        npv = sum(cf / (1 + irr) ** t for t, cf in cash_flows.items())
+        assert npv == pytest.approx(0.0, abs=1e-6)
+
+
+class TestDCFValuation:
+    """DCF 평가 테스트"""
+
+    def test_enterprise_value_matches_power_discounting(self):
+        """호너 방식 할인이 (1+WACC)^t 할인과 일치"""
+        dcf = pe.DCFValuation(initial_ebitda=100.0, wacc=0.08)
+        fcf = dcf.project_fcf(5, 0.1)
+        terminal_value = 700.0
+        t = np.arange(1, fcf.size + 1)
+        expected = np.sum(fcf / 1.08 ** t) + terminal_value / 1.08 ** fcf.size
+        assert dcf.calculate_enterprise_value(fcf, terminal_value) == pytest.approx(expected)
+
+    def test_enterprise_value_empty_fcf(self):
+        """예측 기간이 없으면 터미널 가치를 할인하지 않음"""
+        dcf = pe.DCFValuation(initial_ebitda=100.0, wacc=0.08)
+        assert dcf.calculate_enterprise_value(np.array([]), 10.0) == 10.0
+
+
+class TestLBOAnalysisSummary:
+    """LBO 요약 및 거래 스크리닝 테스트"""
+
+    def test_screen_deals_matches_generate_summary(self):
+        """병렬 스크리닝이 거래별 generate_summary와 일치"""
+        rng = np.random.default_rng(0)
+        n = 50
+        ebitda = rng.uniform(50, 200, n)
+        wacc = rng.uniform(0.06, 0.12, n)
+        growth = rng.uniform(0.0, 0.15, n)
+        exit_multiple = rng.uniform(5, 10, n)
+        equity = np.round(rng.uniform(200, 400, n), 2)
+        debt = np.round(rng.uniform(400, 800, n), 2)
+
+        screened = pe.LBOAnalysisSummary.screen_deals(
+            ebitda, wacc, growth, exit_multiple, equity, debt
+        )
+        for i in range(n):
+            lbo = pe.LBOModel(equity[i] + debt[i], equity[i], debt[i])
+            dcf = pe.DCFValuation(ebitda[i], wacc=wacc[i])
+            summary = pe.LBOAnalysisSummary.generate_summary(
+                lbo, dcf, entry_multiple=8.0, exit_multiple=exit_multiple[i],
+                revenue_growth=growth[i]
+            )
+            assert screened['exit_enterprise_value'][i] == pytest.approx(
+                summary['exit_enterprise_value'], rel=1e-12)
+            assert screened['equity_proceeds'][i] == pytest.approx(
+                summary['equity_proceeds'], rel=1e-12, abs=1e-9)
+            assert screened['moic'][i] == pytest.approx(summary['moic'], rel=1e-12, abs=1e-12)
+
+    def test_screen_deals_compiles_lazily(self):
+        """gufunc은 import 시점이 아니라 첫 screen_deals 호출 때 컴파일"""
+        module = load_model('private-equity')
+        assert module._summarize_deal.cache_info().currsize == 0
+
+        module.LBOAnalysisSummary.screen_deals(100.0, 0.08, 0.1, 7.0, 300.0, 700.0)
+        assert module._summarize_deal.cache_info().currsize == 1
@@ -0,0 +1,215 @@
+"""
+리스크 관리 모델 테스트
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from conftest import load_model
+
+
+rm = load_model('risk-management')
+
+
+class TestRiskMetrics:
+    """위험 지표 테스트"""
+
+    def test_drawdown_matches_accumulate(self):
+        """Numba 루프가 누적 최고점 기반 계산과 일치"""
+        rng = np.random.default_rng(0)
+        prices = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, 500)))
+        running_max = np.maximum.accumulate(prices)
+        expected = np.abs((prices - running_max) / running_max)
+
+        np.testing.assert_allclose(rm.RiskMetrics.drawdown(prices), expected, rtol=0, atol=1e-15)
+        assert rm.RiskMetrics.max_drawdown(prices) == pytest.approx(expected.max(), abs=1e-15)
+
+    def test_empty_prices(self):
+        """빈 가격 배열은 메모리를 읽지 않고 처리"""
+        assert rm.RiskMetrics.drawdown(np.array([])).size == 0
+        with pytest.raises(ValueError):
+            rm.RiskMetrics.max_drawdown(np.array([]))
+
+
+def _baseline_var_cvar(returns, alpha):
+    """부분 정렬 도입 전 구현 (np.percentile + 마스크 평균)"""
+    var_percentile = np.percentile(returns, alpha * 100)
+    return var_percentile, returns[returns <= var_percentile].mean()
+
+
+class TestVaRCalculator:
+    """VaR/CVaR 계산 테스트"""
+
+    @pytest.mark.parametrize('n', [1, 2, 3, 10, 101, 1000, 20000])
+    @pytest.mark.parametrize('confidence_level', [0.9, 0.95, 0.975, 0.99])
+    def test_matches_percentile_and_mask(self, n, confidence_level):
+        """부분 정렬 분위수가 np.percentile, CVaR이 마스크 평균과 일치"""
+        rng = np.random.default_rng(n)
+        returns = rng.normal(0.0005, 0.02, n)
+        calc = rm.VaRCalculator(returns, confidence_level)
+        var_percentile, cvar_return = _baseline_var_cvar(returns, calc.alpha)
+
+        assert calc.historical_var(1.0) == abs(var_percentile)
+        assert calc.conditional_var(1.0) == pytest.approx(abs(cvar_return), rel=1e-14)
+
+    @pytest.mark.parametrize('decimals', [1, 2, 3])
+    def test_tied_returns(self, decimals):
+        """분위수와 같은 값이 여러 개여도 마스크 평균과 일치"""
+        rng = np.random.default_rng(decimals)
+        returns = np.round(rng.normal(0.0, 0.05, 5000), decimals)
+        calc = rm.VaRCalculator(returns, 0.95)
+        var_percentile, cvar_return = _baseline_var_cvar(returns, calc.alpha)
+
+        assert calc.historical_var(1.0) == abs(var_percentile)
+        assert calc.conditional_var(1.0) == pytest.approx(abs(cvar_return), rel=1e-14)
+
+    def test_constant_returns(self):
+        """모든 수익률이 같으면 VaR = CVaR = 그 값"""
+        calc = rm.VaRCalculator(np.full(250, -0.01), 0.95)
+        assert calc.historical_var(100.0) == pytest.approx(1.0)
+        assert calc.conditional_var(100.0) == pytest.approx(1.0)
+
+
+class TestCorrelationAnalysis:
+    """상관관계 분석 테스트"""
+
+    @pytest.mark.parametrize('window', [2, 5, 30, 64, 100])
+    @pytest.mark.parametrize('level', [0.0, 1e4])
+    def test_rolling_correlation_matches_corrcoef(self, window, level):
+        """슬라이딩 합 커널이 윈도우별 np.corrcoef와 일치 (재계산 경계 포함)"""
+        rng = np.random.default_rng(window)
+        x = level + np.cumsum(rng.normal(0, 1, 1000))
+        y = 0.5 * x + rng.normal(0, 1, 1000)
+        expected = np.array([
+            np.corrcoef(x[i:i + window], y[i:i + window])[0, 1]
+            for i in range(len(x) - window)
+        ])
+
+        result = rm.CorrelationAnalysis.rolling_correlation(x, y, window)
+        np.testing.assert_allclose(result, expected, rtol=0, atol=1e-9)
+
+    def test_rolling_correlation_short_series(self):
+        """윈도우보다 짧거나 같은 시계열은 빈 배열"""
+        x = np.arange(10.0)
+        assert rm.CorrelationAnalysis.rolling_correlation(x, x, 10).size == 0
+        assert rm.CorrelationAnalysis.rolling_correlation(x, x, 20).size == 0
+
+    def test_rolling_correlation_invalid_input(self):
+        """길이가 다른 시계열이나 1 미만의 윈도우는 거부"""
+        x = np.arange(100.0)
+        with pytest.raises(ValueError):
+            rm.CorrelationAnalysis.rolling_correlation(x, x[:60], 30)
+        with pytest.raises(ValueError):
+            rm.CorrelationAnalysis.rolling_correlation(x[:60], x, 30)
+        with pytest.raises(ValueError):
+            rm.CorrelationAnalysis.rolling_correlation(x, x, 0)
+
+
+def _optimizer(mu, cov):
+    """기대 수익률 mu, 공분산 cov를 갖는 PortfolioOptimizer"""
+    columns = [f'A{i}' for i in range(len(mu))]
+    returns = pd.DataFrame([mu, mu], columns=columns)
+    return rm.PortfolioOptimizer(returns, pd.DataFrame(cov, index=columns, columns=columns))
+
+
+def _slsqp(objective, n):
+    """해석해 도입 전 구현과 같은 SLSQP 기준해"""
+    from scipy.optimize import minimize
+
+    return minimize(
+        objective,
+        np.full(n, 1 / n),
+        method='SLSQP',
+        bounds=tuple((0, 1) for _ in range(n)),
+        constraints={'type': 'eq', 'fun': lambda x: np.sum(x) - 1},
+    ).x
+
+
+# 양수 제약이 걸리지 않는 경우 (해석해)
+SLACK_MU = np.array([0.08, 0.10, 0.12])
+SLACK_COV = np.array([[0.04, 0.006, 0.004],
+                      [0.006, 0.05, 0.01],
+                      [0.004, 0.01, 0.06]])
+
+# 해석해에 음수 비중이 생기는 경우 (SLSQP 경로)
+# A1은 A0와 상관이 높고 변동성이 커서 최소 분산 해석해에서 공매도되고,
+# A2는 수익률이 낮아 접점 포트폴리오 해석해에서 공매도됨
+BINDING_MU = np.array([0.10, 0.12, 0.01])
+BINDING_COV = np.array([[0.04, 0.054, 0.002],
+                        [0.054, 0.09, 0.003],
+                        [0.002, 0.003, 0.05]])
+
+
+class TestMinimumVariancePortfolio:
+    """최소 분산 포트폴리오 테스트"""
+
+    def test_closed_form_when_slack(self):
+        """양수 제약이 걸리지 않으면 Σ⁻¹1 / 1ᵀΣ⁻¹1과 일치"""
+        result = _optimizer(SLACK_MU, SLACK_COV).minimum_variance_portfolio()
+        inv_ones = np.linalg.solve(SLACK_COV, np.ones(3))
+
+        np.testing.assert_allclose(result['weights'], inv_ones / inv_ones.sum(), atol=1e-12)
+        # 기본 ftol의 SLSQP는 일찍 멈추므로 목적함수로 비교
+        baseline = _slsqp(lambda w: w @ SLACK_COV @ w, 3)
+        assert result['std'] ** 2 <= baseline @ SLACK_COV @ baseline
+
+    def test_slsqp_fallback_when_binding(self):
+        """음수 비중이 생기면 SLSQP로 넘어가고 기준해보다 나쁘지 않음"""
+        inv_ones = np.linalg.solve(BINDING_COV, np.ones(3))
+        assert np.any(inv_ones / inv_ones.sum() < 0)
+
+        weights = _optimizer(BINDING_MU, BINDING_COV).minimum_variance_portfolio()['weights']
+        baseline = _slsqp(lambda w: w @ BINDING_COV @ w, 3)
+
+        assert np.all(weights >= 0)
+        assert weights.sum() == pytest.approx(1.0)
+        assert weights @ BINDING_COV @ weights <= baseline @ BINDING_COV @ baseline + 1e-12
+
+    def test_singular_covariance(self):
+        """공분산이 특이하면 SLSQP로 넘어감"""
+        cov = np.array([[0.04, 0.04, 0.0],
+                        [0.04, 0.04, 0.0],
+                        [0.0, 0.0, 0.09]])
+        weights = _optimizer(SLACK_MU, cov).minimum_variance_portfolio()['weights']
+
+        assert np.all(weights >= 0)
+        assert weights.sum() == pytest.approx(1.0)
+        assert weights[:2].sum() == pytest.approx(0.09 / 0.13, abs=1e-4)
+
+
+def _sharpe(weights, mu, cov, risk_free_rate=0.02):
+    return (mu @ weights - risk_free_rate) / np.sqrt(weights @ cov @ weights)
+
+
+class TestMaximumSharpePortfolio:
+    """샤프 비율 최대화 포트폴리오 테스트"""
+
+    def test_closed_form_when_slack(self):
+        """양수 제약이 걸리지 않으면 Σ⁻¹(μ - rf)를 정규화한 값과 일치"""
+        result = _optimizer(SLACK_MU, SLACK_COV).maximum_sharpe_portfolio()
+        z = np.linalg.solve(SLACK_COV, SLACK_MU - 0.02)
+
+        np.testing.assert_allclose(result['weights'], z / z.sum(), atol=1e-12)
+        baseline = _slsqp(lambda w: -_sharpe(w, SLACK_MU, SLACK_COV), 3)
+        assert result['sharpe'] >= _sharpe(baseline, SLACK_MU, SLACK_COV) - 1e-12
+
+    def test_slsqp_fallback_when_binding(self):
+        """음수 비중이 생기면 SLSQP로 넘어가고 기준해보다 나쁘지 않음"""
+        z = np.linalg.solve(BINDING_COV, BINDING_MU - 0.02)
+        assert np.any(z / z.sum() < 0)
+
+        result = _optimizer(BINDING_MU, BINDING_COV).maximum_sharpe_portfolio()
+        baseline = _slsqp(lambda w: -_sharpe(w, BINDING_MU, BINDING_COV), 3)
+
+        assert np.all(result['weights'] >= 0)
+        assert result['weights'].sum() == pytest.approx(1.0)
+        assert result['sharpe'] >= _sharpe(baseline, BINDING_MU, BINDING_COV) - 1e-9
+
+    def test_all_returns_below_risk_free(self):
+        """초과 수익률이 모두 음수면 해석해를 쓰지 않음"""
+        mu = np.array([0.01, 0.015, 0.005])
+        result = _optimizer(mu, SLACK_COV).maximum_sharpe_portfolio()
+
+        assert np.all(result['weights'] >= 0)
+        assert result['weights'].sum() == pytest.approx(1.0)
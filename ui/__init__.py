@@ -0,0 +1,5 @@
+"""UI 구성 요소 패키지"""
+
+from .static import CUSTOM_CSS, HEADER_HTML, SUBHEADER_HTML, FOOTER_HTML
+
+__all__ = ['CUSTOM_CSS', 'HEADER_HTML', 'SUBHEADER_HTML', 'FOOTER_HTML']
@@ -0,0 +1,40 @@
+"""
+정적 HTML/CSS 조각
+
+대시보드 전체에서 사용하는 스타일과 헤더/푸터 마크업입니다.
+"""
+
+CUSTOM_CSS = """
+    <style>
+    .main-header {
+        font-size: 2.5rem;
+        font-weight: bold;
+        color: #1f77b4;
+        text-align: center;
+        padding: 1rem 0;
+    }
+    .sub-header {
+        font-size: 1.2rem;
+        color: #666;
+        text-align: center;
+        padding-bottom: 2rem;
+    }
+    .metric-card {
+        background-color: #f0f2f6;
+        padding: 1rem;
+        border-radius: 0.5rem;
+        margin: 0.5rem 0;
+    }
+    </style>
+"""
+
+HEADER_HTML = '<div class="main-header">📊 파생상품 시뮬레이션 대시보드</div>'
+
+SUBHEADER_HTML = '<div class="sub-header">Financial Derivatives Simulation Dashboard</div>'
+
+FOOTER_HTML = """
+<div style='text-align: center; color: #666; padding: 1rem;'>
+    <p>📊 파생상품 시뮬레이션 대시보드 v1.0</p>
+    <p>⚠️ 교육용 도구입니다. 실제 투자 결정에 사용하지 마세요.</p>
+</div>
+"""
@@ -2,8 +2,31 @@
 금융 계산 유틸리티 함수
 """
 
+import math
+
 import numpy as np
-from typing import List, Dict
+from typing import List, Dict, Tuple
+
+
+# 연간 거래일 수
+TRADING_DAYS = 252
+SQRT_TRADING_DAYS = math.sqrt(TRADING_DAYS)
+
+
+def _mean_std(x: np.ndarray) -> Tuple[float, float]:
+    """
+    평균과 (모)표준편차를 합계와 내적 한 번씩으로 계산
+
+    분산 = E[x²] - E[x]² 이므로 일별 수익률처럼 평균이 표준편차에 비해
+    작은 데이터에 사용합니다.
+    """
+    n = x.size
+    mean = x.sum() / n
+    var = np.dot(x, x) / n - mean * mean
+    # 반올림 오차 수준의 분산(상수 시계열 등)은 0으로 처리
+    if var <= 8 * np.finfo(np.float64).eps * mean * mean:
+        var = 0.0
+    return mean, np.sqrt(var)
 
 
 def calculate_portfolio_value(positions: List[Dict]) -> float:
@@ -20,8 +43,10 @@ def calculate_portfolio_value(positions: List[Dict]) -> float:
     float
         총 포트폴리오 가치
     """
-    total = sum(pos.get('quantity', 0) * pos.get('price', 0) for pos in positions)
-    return total
+    n = len(positions)
+    quantities = np.fromiter((pos.get('quantity', 0) for pos in positions), dtype=np.float64, count=n)
+    prices = np.fromiter((pos.get('price', 0) for pos in positions), dtype=np.float64, count=n)
+    return float(np.dot(quantities, prices))
 
 
 def calculate_historical_volatility(prices: np.ndarray, window: int = 30) -> float:
@@ -43,17 +68,19 @@ def calculate_historical_volatility(prices: np.ndarray, window: int = 30) -> flo
     if len(prices) < 2:
         return 0.0
 
-    # 로그 수익률 계산
-    returns = np.log(prices[1:] / prices[:-1])
+    # 최근 window 개 수익률에 필요한 가격만 사용
+    prices = np.asarray(prices, dtype=np.float64)
+    if 0 < window < len(prices) - 1:
+        prices = prices[-(window + 1):]
 
-    # 최근 window 개 데이터 사용
-    recent_returns = returns[-window:] if len(returns) > window else returns
+    # 로그 수익률 계산
+    recent_returns = np.diff(np.log(prices))
 
     # 일별 변동성
-    daily_vol = np.std(recent_returns)
+    _, daily_vol = _mean_std(recent_returns)
 
     # 연율 변동성 (252 거래일 가정)
-    annual_vol = daily_vol * np.sqrt(252)
+    annual_vol = daily_vol * SQRT_TRADING_DAYS
 
     return annual_vol
 
@@ -61,7 +88,7 @@ def calculate_historical_volatility(prices: np.ndarray, window: int = 30) -> flo
 def calculate_sharpe_ratio(
     returns: np.ndarray,
     risk_free_rate: float = 0.02,
-    periods_per_year: int = 252
+    periods_per_year: int = TRADING_DAYS
 ) -> float:
     """
     샤프 비율 계산
@@ -83,11 +110,13 @@ def calculate_sharpe_ratio(
     if len(returns) == 0:
         return 0.0
 
+    mean_return, std_return = _mean_std(np.asarray(returns, dtype=np.float64).ravel())
+
     # 평균 수익률
-    mean_return = np.mean(returns) * periods_per_year
+    mean_return = mean_return * periods_per_year
 
     # 표준편차
-    std_return = np.std(returns) * np.sqrt(periods_per_year)
+    std_return = std_return * math.sqrt(periods_per_year)
 
     if std_return == 0:
         return 0.0
@@ -142,28 +142,11 @@ def create_greeks_heatmap(
     # 변동성 범위 (10%-40%)
     sigma_range = np.linspace(0.10, 0.40, 30)
 
-    # Greeks 계산
-    greek_values = np.zeros((len(sigma_range), len(S_range)))
-
-    for i, sigma in enumerate(sigma_range):
-        for j, S in enumerate(S_range):
-            try:
-                bs = BlackScholesModel(S, K, T, r, sigma)
-
-                if greek_type.lower() == 'delta':
-                    value = bs.call_delta() if option_type == 'call' else bs.put_delta()
-                elif greek_type.lower() == 'gamma':
-                    value = bs.gamma()
-                elif greek_type.lower() == 'theta':
-                    value = bs.call_theta() / 365 if option_type == 'call' else bs.put_theta() / 365
-                elif greek_type.lower() == 'vega':
-                    value = bs.vega()
-                else:
-                    value = 0
-
-                greek_values[i, j] = value
-            except:
-                greek_values[i, j] = np.nan
+    # Greeks 계산 (행: 변동성, 열: 기초자산 가격)
+    greek = 'theta_daily' if greek_type.lower() == 'theta' else greek_type
+    greek_values = BlackScholesModel.greeks_grid(
+        S_range[None, :], K, T, r, sigma_range[:, None], greek, option_type
+    )
 
     # 히트맵 생성
     fig = go.Figure(data=go.Heatmap(
@@ -217,36 +200,25 @@ def create_multi_strategy_payoff(
     price_max = K_avg * (1 + price_range_pct)
     price_range = np.linspace(price_min, price_max, 200)
 
+    # 전략별 손익 행렬 (행: 전략, 열: 가격)
+    K = np.asarray(K_values, dtype=np.float64)[:, None]
+    is_call = np.array([s['type'].lower() == 'call' for s in strategies])[:, None]
+    sign = np.array([1.0 if s['position'].lower() == 'long' else -1.0 for s in strategies])[:, None]
+    premium = np.array([s['premium'] for s in strategies], dtype=np.float64)[:, None]
+
+    intrinsic = np.maximum(np.where(is_call, price_range - K, K - price_range), 0)
+    payoffs = sign * (intrinsic - premium)
+    total_payoff = payoffs.sum(axis=0)
+
     fig = go.Figure()
 
-    total_payoff = np.zeros_like(price_range)
-
-    # 각 전략의 손익 계산
-    for strategy in strategies:
-        option_type = strategy['type']
-        position = strategy['position']
-        K = strategy['K']
-        premium = strategy['premium']
-
-        if option_type.lower() == 'call':
-            if position.lower() == 'long':
-                payoff = np.maximum(price_range - K, 0) - premium
-            else:
-                payoff = premium - np.maximum(price_range - K, 0)
-        else:  # put
-            if position.lower() == 'long':
-                payoff = np.maximum(K - price_range, 0) - premium
-            else:
-                payoff = premium - np.maximum(K - price_range, 0)
-
-        total_payoff += payoff
-
-        # 개별 전략 표시
+    # 개별 전략 표시
+    for strategy, payoff in zip(strategies, payoffs):
         fig.add_trace(go.Scatter(
             x=price_range,
             y=payoff,
             mode='lines',
-            name=f"{position.capitalize()} {option_type.capitalize()} K=${K}",
+            name=f"{strategy['position'].capitalize()} {strategy['type'].capitalize()} K=${strategy['K']}",
             line=dict(width=1, dash='dot'),
             opacity=0.5
         ))